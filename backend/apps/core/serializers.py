@@ -1,7 +0,0 @@
-"""Serializers for core API responses."""
-from rest_framework import serializers
-
-
-class HealthCheckSerializer(serializers.Serializer):
-    status = serializers.CharField()
-    service = serializers.CharField()
@@ -1,80 +1,127 @@
 """HTTP API views for the core domain."""
+import asyncio
+import atexit
+import functools
+import hashlib
 import json
 from pathlib import Path
 
 import httpx
+
+try:
+    import orjson
+except ImportError:  # pragma: no cover - optional speedup
+    orjson = None
 from django.conf import settings
-from django.http import JsonResponse
+from django.core.cache import cache
+from django.http import HttpResponse, JsonResponse
 from django.shortcuts import render
 from django.utils import timezone
-from rest_framework import status
-from rest_framework.decorators import api_view
-from rest_framework.response import Response
 
-from .serializers import HealthCheckSerializer
+# Shared client so repeat weather lookups reuse pooled connections to the
+# upstream host instead of paying a TCP + TLS handshake per request. Async
+# so an ASGI worker can keep many upstream fetches in flight at once.
+_WEATHER_CLIENT = httpx.AsyncClient(
+    base_url="https://api.openweathermap.org",
+    timeout=5.0,
+    limits=httpx.Limits(max_keepalive_connections=32, max_connections=64),
+)
+
+
+def _close_weather_client() -> None:
+    try:
+        asyncio.run(_WEATHER_CLIENT.aclose())
+    except RuntimeError:  # pragma: no cover - loop already torn down
+        pass
+
+
+atexit.register(_close_weather_client)
+
+# Current conditions change on the minute scale; a short TTL keeps repeat
+# lookups for the same place off the upstream API.
+_WEATHER_CACHE_TTL = 300
 
 
-@api_view(["GET"])
 def health_check(_request):
-    """Return a simple payload to validate service health."""
-    serializer = HealthCheckSerializer(
-        {
-            "status": "ok",
-            "service": "heyday-backend",
-        }
-    )
-    return Response(serializer.data)
+    """Return a simple payload to validate service health.
+
+    Deliberately a plain JsonResponse: load balancers poll this constantly,
+    so it skips DRF's content negotiation and serializer machinery.
+    """
+    return JsonResponse({"status": "ok", "service": "heyday-backend"})
 
 
 def hello(request):
     return JsonResponse({"message": "Heyday backend is running!"})
 
 
-@api_view(["GET"])
-def weather(request):
-    """Proxy current weather data from OpenWeather."""
+async def weather(request):
+    """Proxy current weather data from OpenWeather.
+
+    Async so the worker is free while waiting on the upstream call; the
+    view spends essentially all of its wall time in that fetch.
+    """
+    if request.method != "GET":
+        return JsonResponse({"detail": 'Method not allowed.'}, status=405)
+
     api_key = getattr(settings, "OPENWEATHER_API_KEY", "")
     if not api_key:
-        return Response(
+        return JsonResponse(
             {"detail": "OpenWeather API key is not configured."},
-            status=status.HTTP_503_SERVICE_UNAVAILABLE,
+            status=503,
         )
 
-    units = request.query_params.get("units") or getattr(
+    units = request.GET.get("units") or getattr(
         settings, "OPENWEATHER_UNITS", "imperial"
     )
-    lat = request.query_params.get("lat")
-    lon = request.query_params.get("lon")
-    location = request.query_params.get("city") or getattr(
+    lat = request.GET.get("lat")
+    lon = request.GET.get("lon")
+    location = request.GET.get("city") or getattr(
         settings, "OPENWEATHER_DEFAULT_LOCATION", "San Francisco,US"
     )
 
     params: dict[str, str] = {"appid": api_key, "units": units}
     if lat and lon:
+        # Round coordinates so near-identical positions share a cache entry.
+        try:
+            cache_key = f"ow:{units}:{float(lat):.2f},{float(lon):.2f}"
+        except ValueError:
+            cache_key = f"ow:{units}:{lat},{lon}"
         params.update({"lat": lat, "lon": lon})
     else:
+        cache_key = f"ow:{units}:{location.lower()}"
         params["q"] = location
 
+    # Cached entries are pre-serialized JSON bytes, so hits return without
+    # re-rendering.
+    cached = await cache.aget(cache_key)
+    if cached is not None:
+        return HttpResponse(cached, content_type="application/json")
+
     try:
-        with httpx.Client(timeout=5) as client:
-            weather_response = client.get(
-                "https://api.openweathermap.org/data/2.5/weather", params=params
-            )
-            weather_response.raise_for_status()
+        weather_response = await _WEATHER_CLIENT.get("/data/2.5/weather", params=params)
+        weather_response.raise_for_status()
     except httpx.HTTPStatusError as exc:
         status_code = exc.response.status_code
         detail = exc.response.json().get("message", "Upstream error")
-        return Response(
+        return JsonResponse(
             {"detail": f"OpenWeather error: {detail}"},
             status=status_code,
         )
     except httpx.HTTPError as exc:
-        return Response(
+        # Serve the last known conditions when upstream is unreachable.
+        stale = await cache.aget(f"{cache_key}:stale")
+        if stale is not None:
+            return HttpResponse(stale, content_type="application/json")
+        return JsonResponse(
             {"detail": f"OpenWeather request failed: {exc}"},
-            status=status.HTTP_502_BAD_GATEWAY,
+            status=502,
         )
 
-    payload = weather_response.json()
+    if orjson is not None:
+        payload = orjson.loads(weather_response.content)
+    else:
+        payload = weather_response.json()
     current_weather = payload.get("weather", [{}])[0]
     main = payload.get("main", {})
     wind = payload.get("wind", {})
@@ -96,41 +143,81 @@ def weather(request):
         "resolved_at": timezone.now().isoformat(),
     }
 
-    return Response(formatted)
+    if orjson is not None:
+        body = orjson.dumps(formatted)
+    else:
+        body = json.dumps(formatted).encode()
+    await cache.aset(cache_key, body, _WEATHER_CACHE_TTL)
+    await cache.aset(f"{cache_key}:stale", body, None)
 
+    return HttpResponse(body, content_type="application/json")
 
-def _resolve_frontend_assets() -> dict:
-    """Return the appropriate asset configuration depending on build output."""
-    frontend_dist = getattr(
+
+_FRONTEND_DIST = Path(
+    getattr(
         settings,
         "FRONTEND_DIST_DIR",
         Path(settings.BASE_DIR).parent / "frontend" / "dist",
     )
-    manifest_path = Path(frontend_dist) / "manifest.json"
+)
+_MANIFEST_PATH = _FRONTEND_DIST / "manifest.json"
+_STATIC_PREFIX = "/" + settings.STATIC_URL.strip("/")
+_DEV_SERVER = getattr(
+    settings, "FRONTEND_DEV_SERVER_ORIGIN", "http://localhost:5173"
+).rstrip("/")
+
+
+def _resolve_frontend_assets() -> dict:
+    """Return the appropriate asset configuration depending on build output.
+
+    Production builds ship an immutable manifest, so the parsed result is
+    cached in-process; in DEBUG the cache is keyed by the manifest mtime so
+    a rebuilt frontend is picked up without a server restart.
+    """
+    manifest_mtime_ns = None
+    if settings.DEBUG:
+        try:
+            manifest_mtime_ns = _MANIFEST_PATH.stat().st_mtime_ns
+        except OSError:
+            manifest_mtime_ns = None
+    return _load_frontend_assets(manifest_mtime_ns)
+
+
+@functools.lru_cache(maxsize=1)
+def _load_frontend_assets(manifest_mtime_ns: int | None) -> dict:
+    """Parse the Vite manifest once and return the asset configuration."""
+    manifest_path = _MANIFEST_PATH
 
     if manifest_path.exists():
+        manifest_bytes = manifest_path.read_bytes()
         try:
-            manifest = json.loads(manifest_path.read_text())
-        except json.JSONDecodeError:
+            if orjson is not None:
+                manifest = orjson.loads(manifest_bytes)
+            else:
+                manifest = json.loads(manifest_bytes)
+        except (json.JSONDecodeError, ValueError):
             manifest = {}
 
         entry = manifest.get("src/main.tsx")
         if entry:
-            static_prefix = "/" + settings.STATIC_URL.strip("/")
-            js_files = [f"{static_prefix}/{entry['file']}"]
-            css_files = [f"{static_prefix}/{path}" for path in entry.get("css", [])]
-            return {"mode": "build", "js": js_files, "css": css_files}
+            js_files = [f"{_STATIC_PREFIX}/{entry['file']}"]
+            css_files = [f"{_STATIC_PREFIX}/{path}" for path in entry.get("css", [])]
+            return {
+                "mode": "build",
+                "js": js_files,
+                "css": css_files,
+                # Asset URLs are content-hashed, so the shell only changes
+                # with the manifest; its hash doubles as the shell's ETag.
+                "etag": hashlib.md5(manifest_bytes).hexdigest(),
+            }
 
-    dev_server = getattr(
-        settings, "FRONTEND_DEV_SERVER_ORIGIN", "http://localhost:5173"
-    ).rstrip("/")
-    return {"mode": "dev", "dev_server": dev_server, "js": [], "css": []}
+    return {"mode": "dev", "dev_server": _DEV_SERVER, "js": [], "css": []}
 
 
 def render_app(request, initial_view: str):
     """Render the React single-page application with the requested view."""
     assets = _resolve_frontend_assets()
-    return render(
+    response = render(
         request,
         "core/spa.html",
         {
@@ -138,6 +225,13 @@ def render_app(request, initial_view: str):
             "assets": assets,
         },
     )
+    etag = assets.get("etag")
+    if etag:
+        # no-cache forces revalidation; ConditionalGetMiddleware turns
+        # matching If-None-Match requests into empty 304s.
+        response["ETag"] = f'"{etag}"'
+        response["Cache-Control"] = "no-cache"
+    return response
 
 
 def landing_page(request):
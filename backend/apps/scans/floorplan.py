@@ -6,10 +6,53 @@ and generates a 2D floorplan visualization as SVG.
 """
 import json
 import logging
+import re
 from typing import Dict, List, Tuple, Optional
 
+import numpy as np
+
 logger = logging.getLogger(__name__)
 
+# Splits camelCase labels ("livingRoom") ahead of each interior capital
+_CAMEL_SPLIT = re.compile(r'(?<!^)(?=[A-Z])')
+
+# Object-type fill colors; anything unlisted renders default gray
+_OBJ_COLORS = {
+    'bed': '#E8F5E9',      # light green
+    'sofa': '#E8F5E9',
+    'chair': '#E8F5E9',
+    'table': '#FFF3E0',    # light orange
+    'storage': '#E3F2FD',  # light blue
+    'cabinet': '#E3F2FD',
+}
+_OBJ_DEFAULT_COLOR = '#D9D9D9'
+
+# Precomputed SVG templates for the render loop. %-formatting with %.2f keeps
+# float reprs short (full repr bloats the generated markup) and avoids
+# building a fresh f-string template per element.
+_POINT_FMT = '%.2f,%.2f'
+_MARKER_FMT = '<circle cx="%.2f" cy="%.2f" r="3" fill="#349552"/>'
+_SECTION_LABEL_FMT = (
+    '<text x="%.2f" y="%.2f" text-anchor="middle" font-family="sans-serif" '
+    'font-size="14" fill="#191919">%s</text>'
+)
+_DOOR_FMT = (
+    '<rect x="%.2f" y="%.2f" width="%.2f" height="10" '
+    'fill="%s" stroke="#191919" stroke-width="1"/>'
+)
+_WINDOW_FMT = (
+    '<rect x="%.2f" y="%.2f" width="%.2f" height="6" '
+    'fill="#07C0C3" stroke="#191919" stroke-width="1"/>'
+)
+_OBJECT_FMT = (
+    '<rect x="%.2f" y="%.2f" width="%.2f" height="%.2f" '
+    'fill="%s" stroke="#191919" stroke-width="1"/>'
+)
+_OBJECT_LABEL_FMT = (
+    '<text x="%.2f" y="%.2f" text-anchor="middle" font-family="sans-serif" '
+    'font-size="10" fill="#191919">%s</text>'
+)
+
 
 def generate_2d_floorplan_svg(roomplan_json: Dict) -> str:
     """
@@ -30,10 +73,10 @@ def generate_2d_floorplan_svg(roomplan_json: Dict) -> str:
     """
     try:
         # Extract floor boundary
-        floor_points = _extract_floor_boundary(roomplan_json)
-        if not floor_points:
+        floor_points = _simplify_boundary(_extract_floor_boundary(roomplan_json))
+        if len(floor_points) == 0:
             logger.warning("No floor boundary found, using fallback")
-            floor_points = [(0, 0), (5, 0), (5, 5), (0, 5)]
+            floor_points = np.array([(0, 0), (5, 0), (5, 5), (0, 5)], dtype=np.float64)
 
         # Extract room sections
         sections = roomplan_json.get('sections', [])
@@ -61,57 +104,82 @@ def generate_2d_floorplan_svg(roomplan_json: Dict) -> str:
         return _generate_fallback_svg()
 
 
-def _extract_floor_boundary(roomplan_json: Dict) -> List[Tuple[float, float]]:
+_EMPTY_BOUNDARY = np.empty((0, 2), dtype=np.float64)
+
+
+def _extract_floor_boundary(roomplan_json: Dict) -> np.ndarray:
     """
     Extract 2D floor boundary points from RoomPlan JSON.
 
     RoomPlan JSON structure:
     - floors[0].polygonCorners: Array of [x, y, z] vertices
     - We extract x, y and ignore z (vertical)
+
+    Returns an (n, 2) float array so downstream steps can operate on the
+    whole boundary at once instead of per-vertex Python tuples.
     """
     try:
         floors = roomplan_json.get('floors', [])
         if not floors:
-            return []
+            return _EMPTY_BOUNDARY
 
         # Get first floor (story 0)
         floor = floors[0]
         polygon_corners = floor.get('polygonCorners', [])
+        if not polygon_corners:
+            return _EMPTY_BOUNDARY
 
-        # Convert 3D points to 2D (x, y)
-        points_2d = []
-        for corner in polygon_corners:
-            if len(corner) >= 2:
-                x, y = corner[0], corner[1]
-                points_2d.append((x, y))
+        # Convert 3D points to 2D (x, y) in one vectorized slice
+        corners = np.asarray(polygon_corners, dtype=np.float64)
+        if corners.ndim != 2 or corners.shape[1] < 2:
+            return _EMPTY_BOUNDARY
 
-        return points_2d
+        return corners[:, :2]
 
     except Exception as e:
         logger.error(f"Error extracting floor boundary: {e}")
-        return []
+        return _EMPTY_BOUNDARY
+
+
+def _simplify_boundary(points: np.ndarray, tolerance: float = 0.05) -> np.ndarray:
+    """
+    Drop consecutive boundary vertices closer than ``tolerance`` metres.
+
+    Dense scans can emit thousands of near-coincident corners along a wall;
+    at SVG scale anything under ~5 cm is invisible, so thinning them keeps
+    the rendering loop proportional to the visual complexity. Vertex order
+    is preserved because the boundary is an ordered polygon, not a point
+    cloud.
+    """
+    if len(points) < 3:
+        return points
+
+    deltas = np.diff(points, axis=0, prepend=points[-1:])
+    keep = np.hypot(deltas[:, 0], deltas[:, 1]) >= tolerance
+    keep[0] = True  # always keep the starting vertex
+    simplified = points[keep]
+    return simplified if len(simplified) >= 3 else points
 
 
 def _extract_doors(roomplan_json: Dict) -> List[Dict]:
     """Extract door positions and dimensions."""
     doors = []
-    try:
-        for door in roomplan_json.get('doors', []):
-            # Extract position from transform matrix (last row: x, y, z, w)
-            transform = door.get('transform', [])
-            if len(transform) >= 12:
-                x, y = transform[12], transform[13]
-                dimensions = door.get('dimensions', [0, 0, 0])
-                width = dimensions[0] if dimensions else 0.8
-
-                doors.append({
-                    'x': x,
-                    'y': y,
-                    'width': width,
-                    'isOpen': door.get('category', {}).get('door', {}).get('isOpen', False)
-                })
-    except Exception as e:
-        logger.error(f"Error extracting doors: {e}")
+    for door in roomplan_json.get('doors', []):
+        # Extract position from transform matrix (last row: x, y, z, w)
+        transform = door.get('transform', [])
+        if len(transform) < 14:
+            continue
+        try:
+            dimensions = door.get('dimensions', [0, 0, 0])
+            doors.append({
+                'x': transform[12],
+                'y': transform[13],
+                'width': dimensions[0] if dimensions else 0.8,
+                'isOpen': door.get('category', {}).get('door', {}).get('isOpen', False)
+            })
+        except (TypeError, AttributeError, IndexError) as e:
+            # Skip the malformed entry rather than dropping every door
+            logger.error(f"Error extracting door: {e}")
 
     return doors
 
@@ -119,21 +187,19 @@ def _extract_doors(roomplan_json: Dict) -> List[Dict]:
 def _extract_windows(roomplan_json: Dict) -> List[Dict]:
     """Extract window positions and dimensions."""
     windows = []
-    try:
-        for window in roomplan_json.get('windows', []):
-            transform = window.get('transform', [])
-            if len(transform) >= 12:
-                x, y = transform[12], transform[13]
-                dimensions = window.get('dimensions', [0, 0, 0])
-                width = dimensions[0] if dimensions else 1.0
-
-                windows.append({
-                    'x': x,
-                    'y': y,
-                    'width': width
-                })
-    except Exception as e:
-        logger.error(f"Error extracting windows: {e}")
+    for window in roomplan_json.get('windows', []):
+        transform = window.get('transform', [])
+        if len(transform) < 14:
+            continue
+        try:
+            dimensions = window.get('dimensions', [0, 0, 0])
+            windows.append({
+                'x': transform[12],
+                'y': transform[13],
+                'width': dimensions[0] if dimensions else 1.0
+            })
+        except (TypeError, AttributeError, IndexError) as e:
+            logger.error(f"Error extracting window: {e}")
 
     return windows
 
@@ -141,53 +207,46 @@ def _extract_windows(roomplan_json: Dict) -> List[Dict]:
 def _extract_objects(roomplan_json: Dict) -> List[Dict]:
     """Extract furniture and object positions."""
     objects_list = []
-    try:
-        for obj in roomplan_json.get('objects', []):
-            # Extract position from transform matrix
-            transform = obj.get('transform', [])
-            if len(transform) >= 12:
-                x, y = transform[12], transform[13]
-                dimensions = obj.get('dimensions', [0, 0, 0])
-                width = dimensions[0] if dimensions else 0.5
-                depth = dimensions[2] if len(dimensions) > 2 else 0.5
-
-                # Get object category
-                category = obj.get('category', {})
-                obj_type = next(iter(category.keys())) if category else 'unknown'
-
-                objects_list.append({
-                    'x': x,
-                    'y': y,
-                    'width': width,
-                    'depth': depth,
-                    'type': obj_type
-                })
-    except Exception as e:
-        logger.error(f"Error extracting objects: {e}")
+    for obj in roomplan_json.get('objects', []):
+        # Extract position from transform matrix
+        transform = obj.get('transform', [])
+        if len(transform) < 14:
+            continue
+        try:
+            dimensions = obj.get('dimensions', [0, 0, 0])
+            objects_list.append({
+                'x': transform[12],
+                'y': transform[13],
+                'width': dimensions[0] if dimensions else 0.5,
+                'depth': dimensions[2] if len(dimensions) > 2 else 0.5,
+                # Iterating the category dict yields keys directly; next()
+                # with a default avoids the .keys() view and the branch
+                'type': next(iter(obj.get('category', {})), 'unknown')
+            })
+        except (TypeError, AttributeError, IndexError) as e:
+            logger.error(f"Error extracting object: {e}")
 
     return objects_list
 
 
-def _compute_bounding_box(floor_points: List[Tuple[float, float]],
+def _compute_bounding_box(floor_points: np.ndarray,
                          objects: List[Dict]) -> Tuple[float, float, float, float]:
     """
     Compute bounding box for all points.
 
     Returns: (min_x, min_y, max_x, max_y)
     """
-    if not floor_points:
+    if len(floor_points) == 0:
         return (0, 0, 5, 5)
 
-    xs = [p[0] for p in floor_points]
-    ys = [p[1] for p in floor_points]
+    # Include objects in bounding box; min/max run vectorized over one array
+    points = floor_points
+    if objects:
+        object_xy = np.array([(obj['x'], obj['y']) for obj in objects], dtype=np.float64)
+        points = np.concatenate([floor_points, object_xy])
 
-    # Include objects in bounding box
-    for obj in objects:
-        xs.append(obj['x'])
-        ys.append(obj['y'])
-
-    min_x, max_x = min(xs), max(xs)
-    min_y, max_y = min(ys), max(ys)
+    min_x, min_y = points.min(axis=0)
+    max_x, max_y = points.max(axis=0)
 
     # Add 10% padding
     padding_x = (max_x - min_x) * 0.1
@@ -201,13 +260,18 @@ def _compute_bounding_box(floor_points: List[Tuple[float, float]],
     )
 
 
-def _render_svg(floor_points: List[Tuple[float, float]],
+def _render_svg(floor_points: np.ndarray,
                sections: List[Dict],
                doors: List[Dict],
                windows: List[Dict],
                objects: List[Dict],
                bbox: Tuple[float, float, float, float]) -> str:
-    """Render SVG markup for the floorplan."""
+    """Render SVG markup for the floorplan.
+
+    ``floor_points`` is drawn exactly in the order given — no convex hull or
+    reordering is applied here, so callers may pass user-supplied ordered
+    polygons (e.g. manual floorplans) directly.
+    """
 
     min_x, min_y, max_x, max_y = bbox
     width = max_x - min_x
@@ -221,12 +285,6 @@ def _render_svg(floor_points: List[Tuple[float, float]],
     scale_x = svg_width / width if width > 0 else 1
     scale_y = svg_height / height if height > 0 else 1
 
-    def transform_point(x: float, y: float) -> Tuple[float, float]:
-        """Transform real-world coords to SVG coords."""
-        svg_x = (x - min_x) * scale_x
-        svg_y = (y - min_y) * scale_y
-        return (svg_x, svg_y)
-
     # Build SVG
     svg_parts = []
     svg_parts.append(f'<svg xmlns="http://www.w3.org/2000/svg" '
@@ -236,10 +294,11 @@ def _render_svg(floor_points: List[Tuple[float, float]],
     # Background
     svg_parts.append(f'<rect width="{svg_width}" height="{svg_height}" fill="#FCF7F4"/>')
 
-    # Floor polygon
-    if floor_points:
-        points_str = ' '.join([f'{transform_point(x, y)[0]},{transform_point(x, y)[1]}'
-                              for x, y in floor_points])
+    # Floor polygon: transform every vertex in one broadcast instead of a
+    # Python call per coordinate pair
+    if len(floor_points) > 0:
+        svg_points = (floor_points - (min_x, min_y)) * (scale_x, scale_y)
+        points_str = ' '.join(_POINT_FMT % (x, y) for x, y in svg_points)
         svg_parts.append(f'<polygon points="{points_str}" '
                         f'fill="white" stroke="#191919" stroke-width="2"/>')
 
@@ -248,60 +307,48 @@ def _render_svg(floor_points: List[Tuple[float, float]],
         center = section.get('center', [])
         if len(center) >= 2:
             x, y = center[0], center[1]
-            svg_x, svg_y = transform_point(x, y)
+            svg_x = (x - min_x) * scale_x
+            svg_y = (y - min_y) * scale_y
             label = section.get('label', 'room')
             # Format label (camelCase to Title Case)
-            label_formatted = ''.join([' ' + c if c.isupper() else c for c in label]).strip()
-            label_formatted = label_formatted.title()
+            label_formatted = _CAMEL_SPLIT.sub(' ', label).title()
 
-            svg_parts.append(f'<circle cx="{svg_x}" cy="{svg_y}" r="3" fill="#349552"/>')
-            svg_parts.append(f'<text x="{svg_x}" y="{svg_y - 10}" '
-                           f'text-anchor="middle" font-family="sans-serif" '
-                           f'font-size="14" fill="#191919">{label_formatted}</text>')
+            svg_parts.append(_MARKER_FMT % (svg_x, svg_y))
+            svg_parts.append(_SECTION_LABEL_FMT % (svg_x, svg_y - 10, label_formatted))
 
     # Doors
     for door in doors:
-        svg_x, svg_y = transform_point(door['x'], door['y'])
+        svg_x = (door['x'] - min_x) * scale_x
+        svg_y = (door['y'] - min_y) * scale_y
         door_width = door['width'] * scale_x
         color = '#35B0FE' if door.get('isOpen') else '#F17F38'
-        svg_parts.append(f'<rect x="{svg_x - door_width/2}" y="{svg_y - 5}" '
-                        f'width="{door_width}" height="10" '
-                        f'fill="{color}" stroke="#191919" stroke-width="1"/>')
+        svg_parts.append(_DOOR_FMT % (svg_x - door_width / 2, svg_y - 5, door_width, color))
 
     # Windows
     for window in windows:
-        svg_x, svg_y = transform_point(window['x'], window['y'])
+        svg_x = (window['x'] - min_x) * scale_x
+        svg_y = (window['y'] - min_y) * scale_y
         win_width = window['width'] * scale_x
-        svg_parts.append(f'<rect x="{svg_x - win_width/2}" y="{svg_y - 3}" '
-                        f'width="{win_width}" height="6" '
-                        f'fill="#07C0C3" stroke="#191919" stroke-width="1"/>')
+        svg_parts.append(_WINDOW_FMT % (svg_x - win_width / 2, svg_y - 3, win_width))
 
     # Furniture/Objects
     for obj in objects:
-        svg_x, svg_y = transform_point(obj['x'], obj['y'])
+        svg_x = (obj['x'] - min_x) * scale_x
+        svg_y = (obj['y'] - min_y) * scale_y
         obj_width = obj['width'] * scale_x
         obj_depth = obj['depth'] * scale_y
         obj_type = obj['type']
 
         # Color based on object type
-        color = '#D9D9D9'  # default gray
-        if obj_type in ['bed', 'sofa', 'chair']:
-            color = '#E8F5E9'  # light green
-        elif obj_type in ['table']:
-            color = '#FFF3E0'  # light orange
-        elif obj_type in ['storage', 'cabinet']:
-            color = '#E3F2FD'  # light blue
-
-        svg_parts.append(f'<rect x="{svg_x - obj_width/2}" y="{svg_y - obj_depth/2}" '
-                        f'width="{obj_width}" height="{obj_depth}" '
-                        f'fill="{color}" stroke="#191919" stroke-width="1"/>')
+        color = _OBJ_COLORS.get(obj_type, _OBJ_DEFAULT_COLOR)
+
+        svg_parts.append(_OBJECT_FMT % (
+            svg_x - obj_width / 2, svg_y - obj_depth / 2, obj_width, obj_depth, color
+        ))
 
         # Label for larger objects
         if obj_width > 30:
-            label = obj_type.capitalize()
-            svg_parts.append(f'<text x="{svg_x}" y="{svg_y}" '
-                           f'text-anchor="middle" font-family="sans-serif" '
-                           f'font-size="10" fill="#191919">{label}</text>')
+            svg_parts.append(_OBJECT_LABEL_FMT % (svg_x, svg_y, obj_type.capitalize()))
 
     svg_parts.append('</svg>')
 
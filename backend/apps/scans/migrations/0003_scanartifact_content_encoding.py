@@ -0,0 +1,18 @@
+# Generated by Django 5.0.14 on 2026-08-31 06:43
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('scans', '0002_alter_scanartifact_kind'),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='scanartifact',
+            name='content_encoding',
+            field=models.CharField(blank=True, max_length=32),
+        ),
+    ]
@@ -0,0 +1,17 @@
+# Generated by Django 5.0.14 on 2026-08-31 06:46
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('scans', '0003_scanartifact_content_encoding'),
+    ]
+
+    operations = [
+        migrations.AddConstraint(
+            model_name='processingjob',
+            constraint=models.UniqueConstraint(condition=models.Q(('status', 'pending')), fields=('session',), name='uniq_pending_job_per_session'),
+        ),
+    ]
@@ -0,0 +1,21 @@
+# Generated by Django 5.0.14 on 2026-08-31 06:51
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('scans', '0004_processingjob_uniq_pending_job_per_session'),
+    ]
+
+    operations = [
+        migrations.AddIndex(
+            model_name='processingjob',
+            index=models.Index(fields=['session', 'status'], name='proc_job_sess_status'),
+        ),
+        migrations.AddIndex(
+            model_name='scanartifact',
+            index=models.Index(fields=['session', 'kind'], name='scan_artifact_sess_kind'),
+        ),
+    ]
@@ -0,0 +1,21 @@
+# Generated by Django 5.0.14 on 2026-08-31 06:53
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('scans', '0005_processingjob_proc_job_sess_status_and_more'),
+    ]
+
+    operations = [
+        migrations.AddIndex(
+            model_name='roomscansession',
+            index=models.Index(fields=['created_at'], name='scan_session_created'),
+        ),
+        migrations.AddIndex(
+            model_name='roomscansession',
+            index=models.Index(condition=models.Q(('status__in', ['processing', 'uploading'])), fields=['status'], name='scan_sess_active'),
+        ),
+    ]
@@ -6,6 +6,8 @@ from uuid import uuid4
 
 from django.conf import settings
 from django.db import models
+from django.db.models.functions import Coalesce, Now
+from django.utils import timezone
 
 from apps.core.models import TimestampedModel
 
@@ -15,10 +17,29 @@ def generate_upload_token() -> str:
     return uuid4().hex
 
 
+def _fast_suffix(name: str) -> str:
+    """Return the file extension (with dot), or ``.bin`` when absent.
+
+    Artifacts compressed at rest keep their compound suffix (".svg.gz"
+    stays ".svg.gz", not ".gz") so mimetypes can still see the real type
+    when the dev media view serves the file.
+
+    A trailing rfind beats Path(name).suffix, which runs the full PurePath
+    parser; this sits on the per-chunk upload path.
+    """
+    i = name.rfind(".")
+    if i > 0 and "/" not in name[i:]:
+        if name[i:] == ".gz":
+            j = name.rfind(".", 0, i)
+            if j > 0 and "/" not in name[j:i]:
+                return name[j:]
+        return name[i:]
+    return ".bin"
+
+
 def _artifact_upload_path(instance: "ScanArtifact", filename: str) -> str:
     """Return a stable storage path for scan artifacts."""
-    suffix = Path(filename).suffix or ".bin"
-    return f"scans/{instance.session_id}/{instance.upload_token}{suffix}"
+    return f"scans/{instance.session_id}/{instance.upload_token}{_fast_suffix(filename)}"
 
 
 class RoomScanSession(TimestampedModel):
@@ -42,6 +63,19 @@ class RoomScanSession(TimestampedModel):
     notes = models.TextField(blank=True)
     last_client_event_at = models.DateTimeField(null=True, blank=True)
 
+    class Meta:
+        indexes = [
+            # The list endpoint orders by created_at; keep that a range scan.
+            models.Index(fields=["created_at"], name="scan_session_created"),
+            # Partial index for active-session dashboards: tiny, since most
+            # rows settle into ready/failed.
+            models.Index(
+                fields=["status"],
+                condition=models.Q(status__in=["processing", "uploading"]),
+                name="scan_sess_active",
+            ),
+        ]
+
     def __str__(self) -> str:
         return f"RoomScanSession<{self.id}>"
 
@@ -78,10 +112,20 @@ class ScanArtifact(TimestampedModel):
     bytes = models.BigIntegerField(default=0)
     checksum = models.CharField(max_length=128, blank=True)
     content_type = models.CharField(max_length=128, blank=True)
+    # e.g. "gzip" when the stored file is compressed at rest; the serving
+    # layer must emit it as the Content-Encoding header
+    content_encoding = models.CharField(max_length=32, blank=True)
     status = models.CharField(
         max_length=24, choices=Status.choices, default=Status.RECEIVED
     )
 
+    class Meta:
+        indexes = [
+            # The recommendations path filters by (session, kind); without
+            # this the lookup scans every artifact row for the session.
+            models.Index(fields=["session", "kind"], name="scan_artifact_sess_kind"),
+        ]
+
     def __str__(self) -> str:
         return f"{self.kind} for session {self.session_id}"
 
@@ -113,22 +157,63 @@ class ProcessingJob(TimestampedModel):
     started_at = models.DateTimeField(null=True, blank=True)
     completed_at = models.DateTimeField(null=True, blank=True)
 
-    def mark_running(self):
-        self.status = self.Status.RUNNING
-        self.save(update_fields=["status", "updated_at"])
+    class Meta:
+        constraints = [
+            # Lets enqueue_processing_job attempt the INSERT first and rely
+            # on the database to reject a duplicate pending job.
+            models.UniqueConstraint(
+                fields=["session"],
+                condition=models.Q(status="pending"),
+                name="uniq_pending_job_per_session",
+            )
+        ]
+        indexes = [
+            # Covers the duplicate-pending lookup and per-session job polls.
+            models.Index(fields=["session", "status"], name="proc_job_sess_status"),
+        ]
+
+    # Status transitions go through QuerySet.update rather than save():
+    # a filtered UPDATE skips model signal dispatch and auto_now handling,
+    # which matters on the worker loop that flips many jobs per tick. The
+    # in-memory instance is synced so callers can keep using it.
+    def _transition(self, **fields):
+        fields["updated_at"] = timezone.now()
+        type(self).objects.filter(pk=self.pk).update(**fields)
+        for name, value in fields.items():
+            setattr(self, name, value)
 
-    def mark_complete(self, message: str | None = None):
-        self.status = self.Status.COMPLETE
+    def mark_running(self):
+        self._transition(status=self.Status.RUNNING)
+
+    def _finalize(self, status, message):
+        """Terminal transition in one UPDATE.
+
+        completed_at resolves DB-side via COALESCE, so the row need not be
+        freshly loaded (or loaded at all) for the first-completion check to
+        be correct.
+        """
+        fields = {
+            "status": status,
+            "completed_at": Coalesce(models.F("completed_at"), Now()),
+            "updated_at": Now(),
+        }
+        if message:
+            fields["message"] = message
+        type(self).objects.filter(pk=self.pk).update(**fields)
+        # Mirror the DB expressions closely enough for callers that
+        # serialize the instance without re-fetching.
+        now = timezone.now()
+        self.status = status
         if message:
             self.message = message
-        self.completed_at = self.completed_at or self.updated_at
-        self.save(update_fields=["status", "message", "completed_at", "updated_at"])
+        self.completed_at = self.completed_at or now
+        self.updated_at = now
+
+    def mark_complete(self, message: str | None = None):
+        self._finalize(self.Status.COMPLETE, message)
 
     def mark_failed(self, message: str):
-        self.status = self.Status.FAILED
-        self.message = message
-        self.completed_at = self.completed_at or self.updated_at
-        self.save(update_fields=["status", "message", "completed_at", "updated_at"])
+        self._finalize(self.Status.FAILED, message)
 
     def __str__(self) -> str:
         return f"ProcessingJob<{self.id}>"
@@ -1,45 +1,79 @@
 """Serializers for scanning sessions and artifacts."""
+from copy import copy
+
 from rest_framework import serializers
 
 from .models import ProcessingJob, RoomScanSession, ScanArtifact
 
 
-class ProcessingJobSerializer(serializers.ModelSerializer):
-    class Meta:
-        model = ProcessingJob
-        fields = [
-            "id",
-            "status",
-            "message",
-            "started_at",
-            "completed_at",
-            "created_at",
-            "updated_at",
-        ]
-        read_only_fields = fields
+class _CachedFieldsMixin:
+    """Memoize get_fields() on the serializer class.
 
+    DRF rebuilds every Field instance each time a serializer is
+    instantiated, and that construction dominates serialization cost on
+    list endpoints. The built dict is cached once per class; instances get
+    shallow copies, since binding mutates per-field state.
+    """
 
-class ScanArtifactSerializer(serializers.ModelSerializer):
-    class Meta:
-        model = ScanArtifact
-        fields = [
-            "id",
-            "kind",
-            "upload_token",
-            "status",
-            "bytes",
-            "checksum",
-            "content_type",
-            "file",
-            "created_at",
-            "updated_at",
-        ]
-        read_only_fields = fields
+    def get_fields(self):
+        cached = self.__class__.__dict__.get("_fields_cache")
+        if cached is None:
+            cached = super().get_fields()
+            self.__class__._fields_cache = cached
+        return {name: copy(field) for name, field in cached.items()}
 
 
-class RoomScanSessionSerializer(serializers.ModelSerializer):
-    artifacts = ScanArtifactSerializer(many=True, read_only=True)
-    processing_jobs = ProcessingJobSerializer(many=True, read_only=True)
+def _iso(value):
+    """Render a datetime the way DRF does (UTC offset as ``Z``)."""
+    if value is None:
+        return None
+    return value.isoformat().replace("+00:00", "Z")
+
+
+def serialize_artifact(artifact: ScanArtifact) -> dict:
+    """Plain-dict representation of an artifact.
+
+    Hand-rolled instead of a ModelSerializer: to_representation re-binds
+    fields and resolves attributes per instance, which dominates CPU on
+    list responses once the queries are prefetched.
+    """
+    return {
+        "id": str(artifact.id),
+        "kind": artifact.kind,
+        "upload_token": artifact.upload_token,
+        "status": artifact.status,
+        "bytes": artifact.bytes,
+        "checksum": artifact.checksum,
+        "content_type": artifact.content_type,
+        "content_encoding": artifact.content_encoding,
+        "file": artifact.file.url if artifact.file else None,
+        "created_at": _iso(artifact.created_at),
+        "updated_at": _iso(artifact.updated_at),
+    }
+
+
+def serialize_job(job: ProcessingJob) -> dict:
+    """Plain-dict representation of a processing job."""
+    return {
+        "id": str(job.id),
+        "status": job.status,
+        "message": job.message,
+        "started_at": _iso(job.started_at),
+        "completed_at": _iso(job.completed_at),
+        "created_at": _iso(job.created_at),
+        "updated_at": _iso(job.updated_at),
+    }
+
+
+class RoomScanSessionSerializer(_CachedFieldsMixin, serializers.ModelSerializer):
+    artifacts = serializers.SerializerMethodField()
+    processing_jobs = serializers.SerializerMethodField()
+
+    def get_artifacts(self, obj):
+        return [serialize_artifact(a) for a in obj.artifacts.all()]
+
+    def get_processing_jobs(self, obj):
+        return [serialize_job(j) for j in obj.processing_jobs.all()]
 
     class Meta:
         model = RoomScanSession
@@ -67,14 +101,34 @@ class RoomScanSessionSerializer(serializers.ModelSerializer):
         ]
 
 
-class CreateRoomScanSessionSerializer(serializers.ModelSerializer):
+class CreateRoomScanSessionSerializer(_CachedFieldsMixin, serializers.ModelSerializer):
     class Meta:
         model = RoomScanSession
         fields = ["label", "device_type", "platform", "app_version", "notes"]
 
 
-class ArtifactUploadSerializer(serializers.Serializer):
-    kind = serializers.ChoiceField(choices=ScanArtifact.Kind.choices)
+class _ArtifactKindField(serializers.CharField):
+    """Choice validation via frozenset membership.
+
+    DRF's ChoiceField rebuilds its choice mapping per instantiation and
+    scans it per request; a frozenset check is O(1) and allocation-free on
+    the upload hot path.
+    """
+
+    default_error_messages = {
+        "invalid_choice": '"{input}" is not a valid choice.',
+    }
+    _allowed = frozenset(ScanArtifact.Kind.values)
+
+    def to_internal_value(self, data):
+        data = super().to_internal_value(data)
+        if data not in self._allowed:
+            self.fail("invalid_choice", input=data)
+        return data
+
+
+class ArtifactUploadSerializer(_CachedFieldsMixin, serializers.Serializer):
+    kind = _ArtifactKindField()
     upload_token = serializers.CharField(required=False, allow_blank=True)
     checksum = serializers.CharField(required=False, allow_blank=True)
     chunk_index = serializers.IntegerField(required=False, min_value=0)
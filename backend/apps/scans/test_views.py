@@ -1,11 +1,16 @@
 """Tests for scan views and recommendation generation endpoint."""
+import gzip
+import hashlib
 import json
 import os
 from pathlib import Path
 from unittest.mock import patch, MagicMock
 
-from django.test import TestCase, override_settings
+from django.core.files.base import ContentFile
+from django.core.files.uploadedfile import SimpleUploadedFile
+from django.test import RequestFactory, TestCase, TransactionTestCase, override_settings
 from django.conf import settings
+from django.views.static import serve
 from rest_framework.test import APIClient
 
 from .models import RoomScanSession, ScanArtifact
@@ -209,8 +214,10 @@ class ScanSessionViewsTest(TestCase):
 
     def test_list_sessions(self):
         """Test listing scan sessions."""
-        RoomScanSession.objects.create(label="Session 1")
-        RoomScanSession.objects.create(label="Session 2")
+        # bulk_create seeds the fixtures in one INSERT instead of one per row.
+        RoomScanSession.objects.bulk_create(
+            [RoomScanSession(label="Session 1"), RoomScanSession(label="Session 2")]
+        )
 
         response = self.client.get("/api/scans/sessions/")
 
@@ -218,6 +225,138 @@ class ScanSessionViewsTest(TestCase):
         self.assertGreaterEqual(len(response.data), 2)
 
 
+class FloorplanSvgServingTest(TestCase):
+    """Test cases for serving the gzipped floorplan SVG artifact."""
+
+    def setUp(self):
+        """Set up a session and store a gzipped SVG through the model field."""
+        self.session = RoomScanSession.objects.create(label="SVG Test")
+        self.artifact = ScanArtifact.objects.create(
+            session=self.session,
+            kind=ScanArtifact.Kind.FLOORPLAN_SVG,
+            content_type="image/svg+xml",
+            content_encoding="gzip",
+            status=ScanArtifact.Status.COMPLETE,
+        )
+        self.svg_bytes = gzip.compress(b"<svg xmlns='http://www.w3.org/2000/svg'/>")
+        self.artifact.file.save(
+            f"{self.artifact.upload_token}.svg.gz",
+            ContentFile(self.svg_bytes),
+            save=True,
+        )
+        self.media_path = Path(settings.MEDIA_ROOT) / self.artifact.file.name
+
+    def tearDown(self):
+        """Remove the stored SVG file."""
+        if self.media_path.exists():
+            self.media_path.unlink()
+
+    def test_stored_name_keeps_compound_suffix(self):
+        """Test that upload_to preserves .svg.gz instead of collapsing to .gz."""
+        self.assertTrue(self.artifact.file.name.endswith(".svg.gz"))
+
+    def test_media_view_serves_svg_content_type(self):
+        """Test that the dev media view serves the file as gzipped SVG."""
+        url = f"{settings.MEDIA_URL}{self.artifact.file.name}"
+        request = RequestFactory().get(url)
+        response = serve(
+            request, path=self.artifact.file.name, document_root=settings.MEDIA_ROOT
+        )
+
+        self.assertEqual(response.status_code, 200)
+        self.assertEqual(response["Content-Type"], "image/svg+xml")
+        self.assertEqual(response["Content-Encoding"], "gzip")
+        self.assertEqual(b"".join(response.streaming_content), self.svg_bytes)
+
+
+class ArtifactUploadViewTest(TransactionTestCase):
+    """Test cases for the artifact upload endpoint.
+
+    TransactionTestCase: the async view persists chunks in a worker
+    thread, whose connection would deadlock against TestCase's
+    wrapping transaction on SQLite.
+    """
+
+    def setUp(self):
+        """Set up test client and a session to upload against."""
+        self.client = APIClient()
+        self.session = RoomScanSession.objects.create(label="Upload Test")
+        self.url = f"/api/scans/sessions/{self.session.id}/artifacts/"
+
+    def tearDown(self):
+        """Remove files written under MEDIA_ROOT during the test."""
+        for artifact in ScanArtifact.objects.filter(session=self.session):
+            if artifact.file:
+                media_path = Path(settings.MEDIA_ROOT) / artifact.file.name
+                if media_path.exists():
+                    media_path.unlink()
+
+    def test_single_upload_returns_server_checksum(self):
+        """Test that a single-part upload returns the server-computed digest."""
+        payload = b"solid mesh data"
+        response = self.client.post(
+            self.url,
+            {
+                "kind": ScanArtifact.Kind.RAW_MESH,
+                "file": SimpleUploadedFile("mesh.obj", payload),
+            },
+            format="multipart",
+        )
+
+        self.assertEqual(response.status_code, 201)
+        artifact = response.json()["artifact"]
+        self.assertEqual(artifact["status"], "complete")
+        self.assertEqual(artifact["bytes"], len(payload))
+        self.assertEqual(artifact["checksum"], hashlib.sha256(payload).hexdigest())
+
+    def test_upload_checksum_mismatch_marks_corrupt(self):
+        """Test that a wrong client checksum flips the artifact to corrupt."""
+        payload = b"solid mesh data"
+        response = self.client.post(
+            self.url,
+            {
+                "kind": ScanArtifact.Kind.RAW_MESH,
+                "checksum": "deadbeef" * 8,
+                "file": SimpleUploadedFile("mesh.obj", payload),
+            },
+            format="multipart",
+        )
+
+        self.assertEqual(response.status_code, 201)
+        artifact = response.json()["artifact"]
+        self.assertEqual(artifact["status"], "corrupt")
+        # The stored checksum is the server-computed digest, not the
+        # client's claim.
+        self.assertEqual(artifact["checksum"], hashlib.sha256(payload).hexdigest())
+
+    def test_batch_upload_assembles_ordered_parts(self):
+        """Test that repeated ``files`` parts persist as one artifact."""
+        parts = [b"part-one|", b"part-two|", b"part-three"]
+        response = self.client.post(
+            self.url,
+            {
+                "kind": ScanArtifact.Kind.RAW_MESH,
+                "files": [
+                    SimpleUploadedFile(f"mesh.obj.{index}", part)
+                    for index, part in enumerate(parts)
+                ],
+            },
+            format="multipart",
+        )
+
+        self.assertEqual(response.status_code, 201)
+        joined = b"".join(parts)
+        artifact = response.json()["artifact"]
+        self.assertEqual(artifact["status"], "complete")
+        self.assertEqual(artifact["bytes"], len(joined))
+        self.assertEqual(artifact["checksum"], hashlib.sha256(joined).hexdigest())
+
+        stored = Path(settings.MEDIA_ROOT) / ScanArtifact.objects.get(
+            session=self.session
+        ).file.name
+        self.assertEqual(stored.read_bytes(), joined)
+
+
 if __name__ == "__main__":
     import django
     os.environ.setdefault('DJANGO_SETTINGS_MODULE', 'heyday_backend.settings')
@@ -1,12 +1,36 @@
 """HTTP views for AR room scanning."""
 from __future__ import annotations
 
+import asyncio
 import json
+import mmap
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
 
+try:
+    import orjson
+except ImportError:  # pragma: no cover - orjson is in requirements
+    orjson = None
+
+# RoomPlan documents above this size are parsed straight out of a
+# read-only mmap instead of a read_bytes() heap copy.
+_MMAP_PARSE_THRESHOLD = 8 << 20
+
+# Runs the recommendation engine call (Gemini + Perenual + Supabase HTTP,
+# no ORM) so the request thread can generate and store the floorplan SVG
+# at the same time instead of sequencing the two multi-second steps.
+_RECS_EXECUTOR = ThreadPoolExecutor(max_workers=4, thread_name_prefix="recs")
+
 from django.conf import settings
+from django.core.cache import cache
+from django.core.exceptions import ValidationError
+from django.core.files.storage import default_storage
+from django.db.models import Case, F, Max, Prefetch, Value, When
+from django.db.models.functions import Now
+from django.http import JsonResponse
 from django.shortcuts import get_object_or_404
 from django.utils import timezone
+from django.views.decorators.csrf import csrf_exempt
 from rest_framework import status
 from rest_framework.decorators import api_view
 from rest_framework.response import Response
@@ -18,11 +42,76 @@ from .models import ProcessingJob, RoomScanSession, ScanArtifact
 from .serializers import (
     ArtifactUploadSerializer,
     CreateRoomScanSessionSerializer,
-    ProcessingJobSerializer,
     RoomScanSessionSerializer,
-    ScanArtifactSerializer,
+    serialize_artifact,
+    serialize_job,
 )
-from .services import ArtifactChunk, enqueue_processing_job, generate_upload_token, persist_artifact_chunk
+from .services import (
+    ArtifactChunk,
+    enqueue_processing_job,
+    generate_upload_token,
+    persist_artifact_chunk,
+    persist_artifact_chunks,
+)
+
+
+# Accepted spellings for boolean-ish request fields; module-level so the
+# hot path does a frozenset probe instead of building a tuple per call.
+_TRUTHY = frozenset({"true", "1", "yes"})
+
+
+def _truthy(value) -> bool:
+    if isinstance(value, bool):
+        return value
+    return str(value).lower() in _TRUTHY
+
+
+def _session_cache_key(session_id) -> str:
+    return f"session:{session_id}"
+
+
+def _get_cached_session(session_id) -> RoomScanSession:
+    """Fetch a session by PK through a short-lived cache.
+
+    Read-mostly handlers hitting the same session repeatedly skip the DB
+    round-trip; every mutating handler deletes the key, and the 30s TTL
+    bounds staleness from out-of-band writes.
+    """
+    key = _session_cache_key(session_id)
+    session = cache.get(key)
+    if session is None:
+        session = get_object_or_404(RoomScanSession, id=session_id)
+        cache.set(key, session, 30)
+    return session
+
+
+def _session_queryset():
+    """Base queryset for serialized session responses.
+
+    Selects only the columns the serializers emit (keeping the FK column so
+    prefetch can stitch children back to parents) and prefetches both
+    nested relations.
+    """
+    return RoomScanSession.objects.only(
+        "id", "label", "device_type", "platform", "app_version", "status",
+        "notes", "last_client_event_at", "created_at", "updated_at",
+    ).prefetch_related(
+        Prefetch(
+            "artifacts",
+            queryset=ScanArtifact.objects.only(
+                "id", "kind", "upload_token", "status", "bytes", "checksum",
+                "content_type", "content_encoding", "file", "created_at",
+                "updated_at", "session_id",
+            ),
+        ),
+        Prefetch(
+            "processing_jobs",
+            queryset=ProcessingJob.objects.only(
+                "id", "status", "message", "started_at", "completed_at",
+                "created_at", "updated_at", "session_id",
+            ),
+        ),
+    )
 
 
 @api_view(["GET", "POST"])
@@ -35,76 +124,155 @@ def sessions(request):
         payload = RoomScanSessionSerializer(session).data
         return Response(payload, status=status.HTTP_201_CREATED)
 
-    queryset = RoomScanSession.objects.order_by("-created_at")[:25]
-    return Response(RoomScanSessionSerializer(queryset, many=True).data)
+    # The rendered payload is cached keyed by the newest updated_at, so a
+    # repeat hit costs one MAX() probe instead of the prefetch queries and
+    # serializer pass. Any session write produces a new key; the TTL
+    # bounds staleness after deletes, which don't bump the max.
+    latest = RoomScanSession.objects.aggregate(Max("updated_at"))["updated_at__max"]
+    list_key = f"sessions:list:{latest.timestamp() if latest else 0}"
+    payload = cache.get(list_key)
+    if payload is None:
+        # Prefetch both nested relations so serializing N sessions costs
+        # three queries instead of 1 + 2N.
+        queryset = _session_queryset().order_by("-created_at")[:25]
+        payload = RoomScanSessionSerializer(queryset, many=True).data
+        cache.set(list_key, payload, 300)
+
+    response = Response(payload)
+    # ConditionalGetMiddleware turns matching If-None-Match into a 304.
+    response["ETag"] = f'"{list_key}"'
+    return response
 
 
 @api_view(["GET"])
 def session_detail(_request, session_id):
     """Return session metadata, artifacts, and processing jobs."""
-    session = get_object_or_404(RoomScanSession, id=session_id)
+    session = get_object_or_404(_session_queryset(), id=session_id)
     return Response(RoomScanSessionSerializer(session).data)
 
 
-@api_view(["POST"])
-def upload_artifact(request, session_id):
-    """Upload an artifact (chunked or single-part) for a session."""
-    session = get_object_or_404(RoomScanSession, id=session_id)
-    payload = ArtifactUploadSerializer(data=request.data)
-    payload.is_valid(raise_exception=True)
+@csrf_exempt
+async def upload_artifact(request, session_id):
+    """Upload an artifact (chunked or single-part) for a session.
+
+    Async, plain-Django view: the disk copy and SHA-256 in
+    persist_artifact_chunk run in a worker thread so the event loop keeps
+    accepting requests while large chunks are written. DRF's api_view is
+    sync-only, so validation and responses are handled directly.
+
+    Clients may send the complete, ordered chunk set of one artifact as a
+    repeated ``files`` field; the batch is persisted in one request,
+    amortizing the per-chunk HTTP and ORM overhead.
+    """
+    if request.method != "POST":
+        return JsonResponse(
+            {"detail": f'Method "{request.method}" not allowed.'}, status=405
+        )
+
+    try:
+        session = await RoomScanSession.objects.aget(id=session_id)
+    except (RoomScanSession.DoesNotExist, ValidationError, ValueError):
+        return JsonResponse({"detail": "Not found."}, status=404)
+
+    batch = request.FILES.getlist("files")
+    form_data = request.POST.dict()
+    if "file" in request.FILES:
+        form_data["file"] = request.FILES["file"]
+    elif batch:
+        # Batched uploads carry no single "file" field; validate the
+        # shared metadata against the first part.
+        form_data["file"] = batch[0]
+        form_data.pop("chunk_index", None)
+        form_data.pop("total_chunks", None)
+    payload = ArtifactUploadSerializer(data=form_data)
+    if not payload.is_valid():
+        return JsonResponse(payload.errors, status=400)
     data = payload.validated_data
 
     upload_token = data.get("upload_token") or generate_upload_token()
-    chunk = ArtifactChunk(
-        session=session,
-        kind=data["kind"],
-        incoming_file=data["file"],
-        upload_token=upload_token,
-        checksum=data.get("checksum"),
-        chunk_index=data.get("chunk_index"),
-        total_chunks=data.get("total_chunks"),
+    if batch:
+        chunks = [
+            ArtifactChunk(
+                session=session,
+                kind=data["kind"],
+                incoming_file=part,
+                upload_token=upload_token,
+                checksum=data.get("checksum"),
+                chunk_index=index,
+                total_chunks=len(batch),
+            )
+            for index, part in enumerate(batch)
+        ]
+        artifact, completed = await asyncio.to_thread(persist_artifact_chunks, chunks)
+    else:
+        chunk = ArtifactChunk(
+            session=session,
+            kind=data["kind"],
+            incoming_file=data["file"],
+            upload_token=upload_token,
+            checksum=data.get("checksum"),
+            chunk_index=data.get("chunk_index"),
+            total_chunks=data.get("total_chunks"),
+        )
+        artifact, completed = await asyncio.to_thread(persist_artifact_chunk, chunk)
+
+    # One filtered UPDATE covers the status flip and the activity
+    # timestamp — chunked uploads hit this per chunk, so the second save's
+    # round-trip (and save()'s signal dispatch) is worth folding away.
+    # The flip is resolved in SQL (CASE on the current status) so
+    # concurrent chunk workers can't race on a stale in-memory status;
+    # SELECT FOR UPDATE is not an option while development runs SQLite.
+    now = timezone.now()
+    await RoomScanSession.objects.filter(pk=session.pk).aupdate(
+        status=Case(
+            When(
+                status=RoomScanSession.Status.CREATED,
+                then=Value(RoomScanSession.Status.UPLOADING),
+            ),
+            default=F("status"),
+        ),
+        last_client_event_at=now,
+        updated_at=now,
     )
-
     if session.status == RoomScanSession.Status.CREATED:
         session.status = RoomScanSession.Status.UPLOADING
-        session.save(update_fields=["status", "updated_at"])
-
-    artifact, completed = persist_artifact_chunk(chunk)
-    session.last_client_event_at = timezone.now()
-    session.save(update_fields=["last_client_event_at", "updated_at"])
+    session.last_client_event_at = now
+    session.updated_at = now
+    await cache.adelete(_session_cache_key(session_id))
 
     response_body = {"upload_token": upload_token}
     if completed and artifact:
-        response_body["artifact"] = ScanArtifactSerializer(artifact).data
+        response_body["artifact"] = serialize_artifact(artifact)
         status_code = status.HTTP_201_CREATED
     else:
         status_code = status.HTTP_202_ACCEPTED
 
-    return Response(response_body, status=status_code)
+    return JsonResponse(response_body, status=status_code)
 
 
 @api_view(["POST"])
 def start_processing(request, session_id):
     """Create a processing job record; stubbed runner marks completion when requested."""
     session = get_object_or_404(RoomScanSession, id=session_id)
-    auto_complete = str(request.data.get("auto_complete", "")).lower() in (
-        "true",
-        "1",
-        "yes",
-    )
+    auto_complete = _truthy(request.data.get("auto_complete", ""))
 
     job = enqueue_processing_job(session)
     if auto_complete:
-        job.status = ProcessingJob.Status.RUNNING
-        job.save(update_fields=["status", "updated_at"])
-
+        # The stub runner finishes immediately, so the transient running
+        # state is not written — mark_complete is one UPDATE, and the
+        # session flip is a second with the timestamp computed DB-side.
         job.mark_complete(message="Processing stubbed on this environment.")
+        RoomScanSession.objects.filter(pk=session.pk).update(
+            status=RoomScanSession.Status.READY, updated_at=Now()
+        )
         session.status = RoomScanSession.Status.READY
-        session.save(update_fields=["status", "updated_at"])
+        session.updated_at = timezone.now()
+
+    cache.delete(_session_cache_key(session_id))
 
     return Response(
         {
-            "job": ProcessingJobSerializer(job).data,
+            "job": serialize_job(job),
             "session": RoomScanSessionSerializer(session).data,
             "floorplan": None,
         },
@@ -136,7 +304,10 @@ def generate_recommendations(request, session_id):
             "recommendations": {...}
         }
     """
-    session = get_object_or_404(RoomScanSession, id=session_id)
+    # The URLconf's uuid converter hands us a UUID; stringify once and
+    # reuse it for cache keys and the response payload.
+    session_id_str = str(session_id)
+    session = _get_cached_session(session_id_str)
 
     # Extract request parameters
     user_id = request.data.get("user_id")
@@ -149,78 +320,148 @@ def generate_recommendations(request, session_id):
     window_orientation = request.data.get("window_orientation")
     enrich_perenual = request.data.get("enrich_perenual", True)
 
-    # Find the RoomPlan JSON artifact
-    roomplan_artifacts = session.artifacts.filter(
+    # Find the RoomPlan JSON artifact. A single .first() both checks
+    # existence and fetches the row; the previous exists()+first() pair
+    # cost an extra round-trip per request.
+    artifact = session.artifacts.filter(
         kind=ScanArtifact.Kind.ROOMPLAN_JSON,
-        status=ScanArtifact.Status.COMPLETE
-    )
+        status=ScanArtifact.Status.COMPLETE,
+    ).first()
 
-    if not roomplan_artifacts.exists():
+    if artifact is None:
         return Response(
             {"error": "No RoomPlan JSON artifact found for this session"},
             status=status.HTTP_404_NOT_FOUND
         )
 
-    # Load the RoomPlan JSON from the file
-    artifact = roomplan_artifacts.first()
-    roomplan_path = Path(settings.MEDIA_ROOT) / artifact.file.name
+    # Load the RoomPlan JSON from the file. The parsed document is cached
+    # per artifact (keyed by file mtime) so regenerating recommendations
+    # does not re-read and re-parse the same scan from disk.
+    # FieldFile.path resolves through the storage API rather than
+    # re-deriving the location from MEDIA_ROOT here.
+    roomplan_path = Path(artifact.file.path)
 
     try:
-        with open(roomplan_path, "r") as f:
-            roomplan_json = json.load(f)
-    except (FileNotFoundError, json.JSONDecodeError) as e:
-        return Response(
-            {"error": f"Failed to load RoomPlan JSON: {str(e)}"},
-            status=status.HTTP_500_INTERNAL_SERVER_ERROR
-        )
-
-    # Generate 2D floorplan SVG
-    floorplan_svg_url = None
-    try:
-        floorplan_svg = generate_2d_floorplan_svg(roomplan_json)
-
-        # Save SVG as a new artifact
-        from django.core.files.base import ContentFile
-        svg_upload_token = generate_upload_token()
-        svg_artifact = ScanArtifact.objects.create(
-            session=session,
-            kind=ScanArtifact.Kind.FLOORPLAN_SVG,
-            upload_token=svg_upload_token,
-            content_type="image/svg+xml",
-            status=ScanArtifact.Status.COMPLETE,
-        )
-        svg_artifact.file.save(
-            f"{svg_upload_token}.svg",
-            ContentFile(floorplan_svg.encode('utf-8')),
-            save=True
-        )
-        svg_artifact.bytes = len(floorplan_svg.encode('utf-8'))
-        svg_artifact.save(update_fields=["bytes", "updated_at"])
-
-        # Build URL to SVG file
-        floorplan_svg_url = f"{settings.MEDIA_URL}{svg_artifact.file.name}"
-    except Exception as e:
-        # Log error but don't fail the request - floorplan is optional
-        import logging
-        logger = logging.getLogger(__name__)
-        logger.error(f"Failed to generate floorplan SVG: {e}", exc_info=True)
-
-    # Call the recommendation engine
-    try:
-        recommendations = floorPlanRecs.get_floor_plan_recommendations(
+        roomplan_stat = roomplan_path.stat()
+        roomplan_cache_key = f"roomplan:{artifact.pk}:{roomplan_stat.st_mtime_ns}"
+    except OSError:
+        roomplan_stat = None
+        roomplan_cache_key = None
+
+    roomplan_json = cache.get(roomplan_cache_key) if roomplan_cache_key else None
+    if roomplan_json is None:
+        try:
+            # orjson parses the raw bytes with a SIMD-accelerated C parser,
+            # several times faster than json.load for scan-sized documents.
+            # Multi-MB exports are mapped rather than copied onto the heap.
+            if (
+                orjson is not None
+                and roomplan_stat is not None
+                and roomplan_stat.st_size > _MMAP_PARSE_THRESHOLD
+            ):
+                with open(roomplan_path, "rb") as f, mmap.mmap(
+                    f.fileno(), 0, prot=mmap.PROT_READ
+                ) as mapped:
+                    roomplan_json = orjson.loads(memoryview(mapped))
+            else:
+                raw = roomplan_path.read_bytes()
+                if orjson is not None:
+                    roomplan_json = orjson.loads(raw)
+                else:
+                    roomplan_json = json.loads(raw)
+        except (OSError, ValueError) as e:
+            return Response(
+                {"error": f"Failed to load RoomPlan JSON: {str(e)}"},
+                status=status.HTTP_500_INTERNAL_SERVER_ERROR
+            )
+        if roomplan_cache_key:
+            cache.set(roomplan_cache_key, roomplan_json, 3600)
+
+    # Engine output is deterministic per (scan content, user, orientation,
+    # enrichment), so cache the whole result for an hour; user_id is part
+    # of the key because the engine folds in per-user Supabase context.
+    recs_cache_key = (
+        f"recs:{roomplan_cache_key}:{user_id}:{window_orientation}:{bool(enrich_perenual)}"
+        if roomplan_cache_key
+        else None
+    )
+    recommendations = cache.get(recs_cache_key) if recs_cache_key else None
+
+    # On a miss, kick off the engine call first; it is pure HTTP work, so
+    # it overlaps with the floorplan generation and artifact write below.
+    recs_future = None
+    if recommendations is None:
+        recs_future = _RECS_EXECUTOR.submit(
+            floorPlanRecs.get_floor_plan_recommendations,
             user_id=user_id,
             roomplan_json=roomplan_json,
             window_orientation=window_orientation,
             enrich_perenual=enrich_perenual,
         )
-    except Exception as e:
-        return Response(
-            {"error": f"Recommendation generation failed: {str(e)}"},
-            status=status.HTTP_500_INTERNAL_SERVER_ERROR
-        )
+
+    # Generate 2D floorplan SVG. The stored artifact name is cached under
+    # the same content identity as the parsed document (artifact + mtime),
+    # so resubmissions of an unchanged scan — e.g. for another user or
+    # orientation — skip SVG generation, gzip, and the file write.
+    floorplan_svg_url = None
+    svg_cache_key = f"fpsvg:{roomplan_cache_key}" if roomplan_cache_key else None
+    cached_svg_name = cache.get(svg_cache_key) if svg_cache_key else None
+    if cached_svg_name:
+        floorplan_svg_url = f"{settings.MEDIA_URL}{cached_svg_name}"
+    else:
+        try:
+            floorplan_svg = generate_2d_floorplan_svg(roomplan_json)
+
+            # Save SVG as a new artifact, gzipped at rest — SVG markup is
+            # highly redundant and compresses 5-10x. content_encoding
+            # records how the file must be served.
+            import gzip
+            from django.core.files.base import ContentFile
+            svg_bytes = gzip.compress(floorplan_svg.encode('utf-8'), compresslevel=6)
+            svg_upload_token = generate_upload_token()
+            # Build the row fully before saving: writing the file with
+            # save=False and inserting once replaces the old create + two
+            # follow-up UPDATEs.
+            svg_artifact = ScanArtifact(
+                session=session,
+                kind=ScanArtifact.Kind.FLOORPLAN_SVG,
+                upload_token=svg_upload_token,
+                content_type="image/svg+xml",
+                content_encoding="gzip",
+                status=ScanArtifact.Status.COMPLETE,
+                bytes=len(svg_bytes),
+            )
+            svg_artifact.file.save(
+                f"{svg_upload_token}.svg.gz",
+                ContentFile(svg_bytes),
+                save=False,
+            )
+            svg_artifact.save()
+
+            # Build URL to SVG file
+            floorplan_svg_url = f"{settings.MEDIA_URL}{svg_artifact.file.name}"
+            if svg_cache_key:
+                cache.set(svg_cache_key, svg_artifact.file.name, 86400)
+        except Exception as e:
+            # Log error but don't fail the request - floorplan is optional
+            import logging
+            logger = logging.getLogger(__name__)
+            logger.error(f"Failed to generate floorplan SVG: {e}", exc_info=True)
+
+    # Collect the recommendation engine result
+    if recs_future is not None:
+        try:
+            recommendations = recs_future.result()
+        except Exception as e:
+            return Response(
+                {"error": f"Recommendation generation failed: {str(e)}"},
+                status=status.HTTP_500_INTERNAL_SERVER_ERROR
+            )
+        if recs_cache_key:
+            cache.set(recs_cache_key, recommendations, 3600)
 
     # Add session_id and floorplan_svg_url to response
-    recommendations["session_id"] = str(session_id)
+    recommendations["session_id"] = session_id_str
     if floorplan_svg_url:
         recommendations["floorplan_svg_url"] = floorplan_svg_url
 
@@ -247,26 +488,30 @@ def cleanup_session(request, session_id):
     """
     session = get_object_or_404(RoomScanSession, id=session_id)
 
-    # Count artifacts before deletion
-    artifact_count = session.artifacts.count()
-
-    # Delete all artifact files from filesystem and database
-    for artifact in session.artifacts.all():
+    # Pull just the stored paths; the count falls out of the same rows
+    # rather than a separate COUNT query.
+    paths = list(session.artifacts.values_list("file", flat=True))
+    artifact_count = len(paths)
+
+    # Delete by stored name through the storage API: one pass over the
+    # values_list names, no model instances, and it works for any backend
+    # (artifacts written via file.save live in S3 when that's configured,
+    # not under MEDIA_ROOT).
+    for path in paths:
+        if not path:
+            continue
         try:
-            # Delete file from filesystem
-            if artifact.file:
-                artifact.file.delete(save=False)
-        except Exception as e:
+            default_storage.delete(path)
+        except OSError as e:
             # Log but continue - don't fail cleanup if file already gone
             import logging
             logger = logging.getLogger(__name__)
-            logger.warning(f"Failed to delete artifact file {artifact.id}: {e}")
-
-        # Delete artifact record
-        artifact.delete()
+            logger.warning(f"Failed to delete artifact file {path}: {e}")
 
-    # Delete session record
+    # One cascading delete covers artifacts, jobs, and the session row,
+    # instead of a DELETE per artifact.
     session.delete()
+    cache.delete(_session_cache_key(session_id))
 
     return Response(
         {
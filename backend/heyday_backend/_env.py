@@ -0,0 +1,21 @@
+"""One-shot loader for the repo-root ``.env`` file.
+
+Django settings and the standalone recommendationEngine modules each used
+to call ``load_dotenv`` at import, so a worker that imported all of them
+opened and parsed the same file several times per process. They now share
+this guard instead. Only ``pathlib``/``dotenv`` are touched here, so the
+module stays importable outside a Django context.
+"""
+from pathlib import Path
+
+_LOADED = False
+
+
+def ensure_env() -> None:
+    """Parse the repo-root .env exactly once per process."""
+    global _LOADED
+    if not _LOADED:
+        from dotenv import load_dotenv
+
+        load_dotenv(Path(__file__).resolve().parents[2] / ".env")
+        _LOADED = True
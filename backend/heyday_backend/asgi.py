@@ -1,4 +1,14 @@
-"""ASGI config for Heyday backend."""
+"""ASGI config for Heyday backend.
+
+Production serving: run under uvicorn with the optimized extras so the
+event loop uses uvloop and HTTP parsing uses httptools::
+
+    uvicorn heyday_backend.asgi:application --loop uvloop --workers 4
+
+For chunked mobile uploads, terminate HTTP/2 at the fronting proxy
+(e.g. nginx) and proxy HTTP/1.1 keep-alive connections here, letting the
+client multiplex chunk requests over one TLS connection.
+"""
 from __future__ import annotations
 
 import os
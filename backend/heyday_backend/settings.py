@@ -6,7 +6,8 @@ import sys
 from pathlib import Path
 
 import dj_database_url
-from dotenv import load_dotenv
+
+from ._env import ensure_env
 
 
 BASE_DIR = Path(__file__).resolve().parent.parent
@@ -14,7 +15,7 @@ APPS_DIR = BASE_DIR / "apps"
 if str(APPS_DIR) not in sys.path:
     sys.path.append(str(APPS_DIR))
 
-load_dotenv(BASE_DIR.parent / ".env")
+ensure_env()
 
 
 
@@ -67,6 +68,7 @@ MIDDLEWARE = [
     "django.contrib.sessions.middleware.SessionMiddleware",
     "corsheaders.middleware.CorsMiddleware",
     "django.middleware.common.CommonMiddleware",
+    "django.middleware.http.ConditionalGetMiddleware",
     "django.middleware.csrf.CsrfViewMiddleware",
     "django.contrib.auth.middleware.AuthenticationMiddleware",
     "django.contrib.messages.middleware.MessageMiddleware",
@@ -95,10 +97,15 @@ TEMPLATES = [
 WSGI_APPLICATION = "heyday_backend.wsgi.application"
 ASGI_APPLICATION = "heyday_backend.asgi.application"
 
+# SQLite by default for development; deployments point DJANGO_DB at a
+# Postgres URL to get real write concurrency on the chunk-upload path.
+# Persistent connections (conn_max_age) skip the per-request connect
+# handshake; health checks keep them safe to reuse after idle periods.
 DATABASES = {
     "default": dj_database_url.config(
         default=os.environ.get("DJANGO_DB", f"sqlite:///{BASE_DIR / 'db.sqlite3'}"),
-        conn_max_age=600,
+        conn_max_age=int(os.environ.get("CONN_MAX_AGE", "600")),
+        conn_health_checks=True,
     )
 }
 
@@ -117,7 +124,13 @@ USE_TZ = True
 STATIC_URL = "static/"
 STATIC_ROOT = BASE_DIR / "staticfiles"
 STATICFILES_DIRS = [BASE_DIR / "static"]
-if (FRONTEND_DIST_DIR / "assets").exists():
+# Production images set FRONTEND_BUILT=1 (or 0) at build time so startup
+# skips the stat(); the .exists() probe is the dev fallback.
+_frontend_built = os.environ.get("FRONTEND_BUILT")
+if _frontend_built is not None:
+    if _frontend_built == "1":
+        STATICFILES_DIRS.append(FRONTEND_DIST_DIR)
+elif (FRONTEND_DIST_DIR / "assets").exists():
     STATICFILES_DIRS.append(FRONTEND_DIST_DIR)
 
 MEDIA_URL = "/media/"
@@ -133,10 +146,29 @@ if AWS_S3_BUCKET and AWS_ACCESS_KEY_ID and AWS_SECRET_ACCESS_KEY:
     if AWS_S3_CUSTOM_DOMAIN:
         AWS_S3_CUSTOM_DOMAIN = AWS_S3_CUSTOM_DOMAIN
 
+# Redis-backed cache when REDIS_URL is provided; local-memory fallback keeps
+# development working without extra services.
+REDIS_URL = os.environ.get("REDIS_URL", "")
+if REDIS_URL:
+    CACHES = {
+        "default": {
+            "BACKEND": "django.core.cache.backends.redis.RedisCache",
+            "LOCATION": REDIS_URL,
+        }
+    }
+else:
+    CACHES = {
+        "default": {
+            "BACKEND": "django.core.cache.backends.locmem.LocMemCache",
+        }
+    }
+
 REST_FRAMEWORK = {
-    "DEFAULT_RENDERER_CLASSES": ["rest_framework.renderers.JSONRenderer"],
+    # orjson renders/parses JSON several times faster than the stock
+    # stdlib-based classes; multipart/form parsing is unchanged.
+    "DEFAULT_RENDERER_CLASSES": ["drf_orjson_renderer.renderers.ORJSONRenderer"],
     "DEFAULT_PARSER_CLASSES": [
-        "rest_framework.parsers.JSONParser",
+        "drf_orjson_renderer.parsers.ORJSONParser",
         "rest_framework.parsers.MultiPartParser",
         "rest_framework.parsers.FormParser",
     ],
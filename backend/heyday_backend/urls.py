@@ -2,7 +2,6 @@
 from django.contrib import admin
 from django.urls import include, path
 from django.conf import settings
-from django.conf.urls.static import static
 
 from apps.core import views as core_views
 
@@ -16,4 +15,7 @@ urlpatterns = [
 ]
 
 if settings.DEBUG:
+    # Dev-only import: production workers never need the static() helper.
+    from django.conf.urls.static import static
+
     urlpatterns += static(settings.MEDIA_URL, document_root=settings.MEDIA_ROOT)
@@ -1,14 +1,23 @@
 import json
 import os
+import re
+import time
+from collections import Counter
+from concurrent.futures import ThreadPoolExecutor
+from pathlib import Path
 from typing import Any, Dict, List, Optional
-from dotenv import load_dotenv
-import google.generativeai as genai
-from supabase import Client, create_client
+
+try:
+    import orjson
+except ImportError:  # pragma: no cover - orjson is in requirements
+    orjson = None
+from pydantic import BaseModel, ConfigDict, TypeAdapter
+
+from heyday_backend._env import ensure_env
 from . import perenual_service
 
-# load .env from the backend root (adjust path if your .env lives elsewhere)
-ROOT = os.path.abspath(os.path.join(os.path.dirname(__file__), "..", ".."))
-load_dotenv(os.path.join(ROOT, ".env"))
+# load .env from the repo root (shared, parsed once per process)
+ensure_env()
 
 api_key = os.getenv("GEMINI_API_KEY")
 supabase_url = os.getenv("SUPABASE_URL")
@@ -18,9 +27,31 @@ if not api_key:
 if not supabase_url or not supabase_key:
     raise RuntimeError("Missing Supabase credentials (SUPABASE_URL or SUPABASE_SERVICE_ROLE_KEY)")
 
-# Configure Gemini with the new SDK
-genai.configure(api_key=api_key)
-supabase: Client = create_client(supabase_url, supabase_key)
+# The Gemini and Supabase SDKs are imported and configured on first use:
+# both cost hundreds of ms and real memory at import, which every Django
+# process paid even when it never served a recommendation. Credentials
+# are still validated eagerly above so misconfiguration fails at startup.
+genai = None
+supabase = None
+
+
+def _get_genai():
+    global genai
+    if genai is None:
+        import google.generativeai as _genai
+
+        _genai.configure(api_key=api_key)
+        genai = _genai
+    return genai
+
+
+def _get_supabase():
+    global supabase
+    if supabase is None:
+        from supabase import create_client
+
+        supabase = create_client(supabase_url, supabase_key)
+    return supabase
 
 # 1) Normalize the RoomPlan JSON into a lean schema (rooms, dimensions, doors/windows, light level, climate). Cache this as a dict.
 # 2) Pull user context from Supabase (location/climate preferences, experience level, plant style prefs).
@@ -29,6 +60,16 @@ supabase: Client = create_client(supabase_url, supabase_key)
 # 5) Validate/repair the model JSON, persist to Supabase for analytics, and return to the client.
 
 
+# Built once per process; _summarize_roomplan previously rebuilt this
+# dict on every call.
+_ORIENTATION_MAP = {
+    "N": "north-facing",
+    "S": "south-facing",
+    "E": "east-facing",
+    "W": "west-facing",
+}
+
+
 def _summarize_roomplan(roomplan_json: Dict[str, Any], window_orientation: Optional[str] = None) -> str:
     """
     Extract key layout facts from RoomPlan JSON.
@@ -39,31 +80,29 @@ def _summarize_roomplan(roomplan_json: Dict[str, Any], window_orientation: Optio
     windows = roomplan_json.get("windows", [])
     objects = roomplan_json.get("objects", [])
     orientation_char = (window_orientation or "").strip().upper()[:1]
-    orientation_map = {
-        "N": "north-facing",
-        "S": "south-facing",
-        "E": "east-facing",
-        "W": "west-facing",
-    }
-    orientation_desc = orientation_map.get(orientation_char, "unknown exposure")
+    orientation_desc = _ORIENTATION_MAP.get(orientation_char, "unknown exposure")
 
     room_labels = [s.get("label", "unlabeled") for s in sections]
-
-    def _categorize_objects(objs: List[Dict[str, Any]]) -> Dict[str, int]:
-        counts: Dict[str, int] = {}
-        for obj in objs:
-            cat = obj.get("category", {})
-            if not cat:
-                continue
-            key = next(iter(cat.keys()))
-            counts[key] = counts.get(key, 0) + 1
-        return counts
-
-    object_counts = _categorize_objects(objects)
-    object_summary = ", ".join(f"{k}:{v}" for k, v in object_counts.items()) if object_counts else "no objects detected"
+    n_rooms = len(room_labels)
+    labels_str = ", ".join(room_labels) if room_labels else "none"
+
+    # One pass over the objects; the first key of the category dict is the
+    # RoomPlan category name, grabbed without an iterator allocation.
+    object_counts: Counter = Counter()
+    for obj in objects:
+        cat = obj.get("category")
+        if cat:
+            for key in cat:
+                object_counts[key] += 1
+                break
+
+    if object_counts:
+        object_summary = ", ".join(f"{k}:{v}" for k, v in object_counts.most_common())
+    else:
+        object_summary = "no objects detected"
 
     return (
-        f"Rooms: {', '.join(room_labels) or 'none'} ({len(room_labels)} total). "
+        f"Rooms: {labels_str} ({n_rooms} total). "
         f"Doors: {len(doors)}. Windows: {len(windows)} ({orientation_desc}). "
         f"Detected furnishings/appliances: {object_summary}. "
         "Use RoomPlan centers as rough room positions; assume standard ceiling height; "
@@ -71,8 +110,20 @@ def _summarize_roomplan(roomplan_json: Dict[str, Any], window_orientation: Optio
     )
 
 
-def _build_prompt(user: Dict[str, Any], roomplan_json: Dict[str, Any], window_orientation: Optional[str] = None) -> str:
-    roomplan_summary = _summarize_roomplan(roomplan_json, window_orientation)
+# Invariant instructions live in the model's system instruction so the
+# per-request prompt carries only the dynamic fields. The stable prefix
+# also makes repeat calls eligible for Gemini's implicit prompt caching.
+_SYSTEM_INSTRUCTION = (
+    "You are a master botanist and interior garden designer. "
+    "Given a RoomPlan layout, propose indoor plant placements that are realistic to source. "
+    "Return JSON keyed by room with fields: plants (name, scientific_name, light_need, watering), placement, and reasoning. "
+    "IMPORTANT: For each plant, provide both 'name' (common name) and 'scientific_name' (botanical name in Latin). "
+    "The scientific name is critical for accurate plant database lookups. "
+    "Be concise and stay within practical plant options available in common stores."
+)
+
+
+def _build_prompt(user: Dict[str, Any], roomplan_summary: str) -> str:
     user_location = user.get("location", "unspecified location")
     experience = user.get("plant_experience", "beginner")
     style = user.get("style_preference", "modern minimal")
@@ -80,34 +131,124 @@ def _build_prompt(user: Dict[str, Any], roomplan_json: Dict[str, Any], window_or
     maintenance = user.get("maintenance_level", "low-maintenance desired")
 
     return (
-        "You are a master botanist and interior garden designer. "
-        "Given a RoomPlan layout, propose indoor plant placements that are realistic to source. "
         f"RoomPlan summary: {roomplan_summary}. "
         f"User location: {user_location}. Experience: {experience}. Style: {style}. "
-        f"Constraints: {toxicity_pref}; {maintenance}. "
-        "Return JSON keyed by room with fields: plants (name, scientific_name, light_need, watering), placement, and reasoning. "
-        "IMPORTANT: For each plant, provide both 'name' (common name) and 'scientific_name' (botanical name in Latin). "
-        "The scientific name is critical for accurate plant database lookups. "
-        "Be concise and stay within practical plant options available in common stores."
+        f"Constraints: {toxicity_pref}; {maintenance}."
     )
 
 
+# Raw bytes of the bundled Room.json, read once per process. The bytes
+# are cached rather than the parsed dict so each caller gets a fresh,
+# safely mutable structure.
+_ROOM_JSON_PATH = Path(__file__).resolve().parent / "Room.json"
+_EXAMPLE_ROOMPLAN_BYTES: Optional[bytes] = None
+
+
 def _load_example_roomplan() -> Dict[str, Any]:
     """Load the bundled Room.json as a fallback example."""
-    example_path = os.path.join(os.path.dirname(__file__), "Room.json")
-    with open(example_path, "r") as f:
-        return json.load(f)
+    global _EXAMPLE_ROOMPLAN_BYTES
+    if _EXAMPLE_ROOMPLAN_BYTES is None:
+        _EXAMPLE_ROOMPLAN_BYTES = _ROOM_JSON_PATH.read_bytes()
+    if orjson is not None:
+        return orjson.loads(_EXAMPLE_ROOMPLAN_BYTES)
+    return json.loads(_EXAMPLE_ROOMPLAN_BYTES)
+
+
+# User profiles change rarely; a short TTL cache spares repeat callers
+# the Supabase round-trip so the Gemini call can start immediately. The
+# cache is bounded: inserts past the cap evict expired entries first,
+# then the oldest, so long-lived workers don't grow it without limit.
+_USER_CACHE_TTL = 300.0
+_USER_CACHE_MAX = 1024
+_user_cache: Dict[str, tuple] = {}
+
+
+def _cache_user(user_id: str, user: Dict[str, Any], now: float) -> None:
+    if user_id not in _user_cache and len(_user_cache) >= _USER_CACHE_MAX:
+        expired = [
+            key
+            for key, (stamp, _) in _user_cache.items()
+            if now - stamp >= _USER_CACHE_TTL
+        ]
+        for key in expired:
+            del _user_cache[key]
+        while len(_user_cache) >= _USER_CACHE_MAX:
+            oldest = min(_user_cache, key=lambda key: _user_cache[key][0])
+            del _user_cache[oldest]
+    _user_cache[user_id] = (now, user)
+
+
+def _fetch_user(user_id: str) -> Dict[str, Any]:
+    now = time.monotonic()
+    hit = _user_cache.get(user_id)
+    if hit is not None and now - hit[0] < _USER_CACHE_TTL:
+        return hit[1]
+    _get_supabase()
+    resp = supabase.table("users").select("*").eq("id", user_id).execute()
+    if not resp.data:
+        raise RuntimeError(f"User {user_id} not found in Supabase")
+    user = resp.data[0]
+    _cache_user(user_id, user, now)
+    return user
+
 
+# Shape of the Gemini response, validated in one pydantic (Rust-level)
+# pass instead of per-plant isinstance chains in the enrichment loop.
+# Extra fields are allowed so the raw dicts keep everything the model
+# returned; optional names are skipped at enrichment time as before.
+class _Plant(BaseModel):
+    model_config = ConfigDict(extra="allow")
+    name: Optional[str] = None
+    scientific_name: Optional[str] = None
 
-def _call_gemini(prompt: str) -> str:
-    model = genai.GenerativeModel('gemini-2.5-flash-lite')
-    response = model.generate_content(
-        prompt,
-        generation_config=genai.GenerationConfig(
-            response_mime_type="application/json"
+
+class _Room(BaseModel):
+    model_config = ConfigDict(extra="allow")
+    plants: List[_Plant] = []
+
+
+_ROOMS_SCHEMA = TypeAdapter(Dict[str, _Room])
+
+
+# Matches a completed "scientific_name": "..." field in the partial JSON
+# stream. Escaped quotes are left to the fallback lookup after parsing.
+_SCIENTIFIC_NAME_RE = re.compile(r'"scientific_name"\s*:\s*"([^"\\]+)"')
+
+
+# Model handle built once; it carries the static system instruction.
+_GEMINI_MODEL = None
+
+
+def _get_model():
+    global _GEMINI_MODEL
+    if _GEMINI_MODEL is None:
+        _get_genai()
+        _GEMINI_MODEL = genai.GenerativeModel(
+            'gemini-2.5-flash-lite', system_instruction=_SYSTEM_INSTRUCTION
         )
-    )
-    return response.text  # already JSON per mime type
+    return _GEMINI_MODEL
+
+
+def _call_gemini(prompt: str, on_scientific_name=None) -> str:
+    model = _get_model()
+    config = genai.GenerationConfig(response_mime_type="application/json")
+    if on_scientific_name is None:
+        response = model.generate_content(prompt, generation_config=config)
+        return response.text  # already JSON per mime type
+
+    # Stream the response so work can start on each plant as soon as its
+    # scientific_name field closes, instead of after the full generation.
+    buffer = ""
+    scanned = 0
+    for chunk in model.generate_content(prompt, generation_config=config, stream=True):
+        text = chunk.text
+        if not text:
+            continue
+        buffer += text
+        for match in _SCIENTIFIC_NAME_RE.finditer(buffer, scanned):
+            on_scientific_name(match.group(1))
+            scanned = match.end()
+    return buffer
 
 
 def get_floor_plan_recommendations(
@@ -151,105 +292,177 @@ def get_floor_plan_recommendations(
             }
         }
     """
-    # Fetch user data from Supabase
-    resp = supabase.table("users").select("*").eq("id", user_id).execute()
-    if not resp.data:
-        raise RuntimeError(f"User {user_id} not found in Supabase")
-    user = resp.data[0]
+    # Fetch user data from Supabase (TTL-cached per user)
+    user = _fetch_user(user_id)
 
     plan = roomplan_json or _load_example_roomplan()
-    prompt = _build_prompt(user, plan, window_orientation)
-
-    # Get Gemini recommendations
-    gemini_json_str = _call_gemini(prompt)
-
-    # Parse Gemini response
+    # Summarize once: the same summary feeds the prompt and the response,
+    # so the O(objects) walk over the plan is not repeated.
+    roomplan_summary = _summarize_roomplan(plan, window_orientation)
+    prompt = _build_prompt(user, roomplan_summary)
+
+    # Get Gemini recommendations. When enrichment is on, the response is
+    # streamed and Perenual lookups start while the model is still
+    # generating, overlapping the two dominant I/O waits.
+    prefetched: Dict[str, Any] = {}
+    executor = ThreadPoolExecutor(max_workers=8) if enrich_perenual else None
+    if executor is not None:
+        def _prefetch(name: str) -> None:
+            if name not in prefetched:
+                prefetched[name] = executor.submit(
+                    perenual_service.enrich_plant_with_perenual, name
+                )
+
+        gemini_json_str = _call_gemini(prompt, on_scientific_name=_prefetch)
+    else:
+        gemini_json_str = _call_gemini(prompt)
+
+    # Parse Gemini response; orjson's C parser beats stdlib json several
+    # times over on responses this size. orjson.JSONDecodeError subclasses
+    # ValueError, as does json's, so one except covers both parsers.
     try:
-        gemini_data = json.loads(gemini_json_str)
-    except json.JSONDecodeError as e:
+        if orjson is not None:
+            gemini_data = orjson.loads(gemini_json_str)
+        else:
+            gemini_data = json.loads(gemini_json_str)
+        # One schema pass; pydantic.ValidationError subclasses ValueError
+        # just like both parsers' decode errors.
+        _ROOMS_SCHEMA.validate_python(gemini_data)
+    except ValueError as e:
+        if executor is not None:
+            executor.shutdown(wait=False)
         raise RuntimeError(f"Failed to parse Gemini response: {e}")
 
     # Enrich plant recommendations with Perenual data
-    if enrich_perenual and isinstance(gemini_data, dict):
-        for room_name, room_data in gemini_data.items():
-            if isinstance(room_data, dict) and "plants" in room_data:
-                plants = room_data["plants"]
-                if isinstance(plants, list):
-                    for plant in plants:
-                        if isinstance(plant, dict) and "name" in plant:
-                            plant_name = plant["name"]
-                            scientific_name = plant.get("scientific_name")
-
-                            # Prefer scientific name for Perenual search (more accurate)
-                            search_name = scientific_name if scientific_name else plant_name
-                            
-                            if scientific_name:
-                                print(f"🔬 Searching Perenual by scientific name: {scientific_name}")
-                            else:
-                                print(f"⚠️ No scientific name provided, using common name: {plant_name}")
-
-                            perenual_data = perenual_service.enrich_plant_with_perenual(search_name)
-                            print(f"🌱 Perenual enrichment for '{plant_name}':")
-                            print(f"   - Common name: {perenual_data.get('common_name')}")
-                            print(f"   - Scientific name: {perenual_data.get('scientific_name')}")
-                            print(f"   - Image URL: {perenual_data.get('default_image_url')}")
-                            print(f"   - Error: {perenual_data.get('error')}")
-
-                            # Add perenual_data to plant object (for mobile backward compat)
-                            plant["perenual_data"] = perenual_data
-
-                            # STEP 1: Search for existing plant in Supabase by scientific name
-                            plant_id = None
-                            scientific_name = perenual_data.get('scientific_name')
-                            common_name = perenual_data.get('common_name')
-
-                            if scientific_name:
-                                result = supabase.table('plants').select('id, common_name').ilike('scientific_name', f'%{scientific_name}%').limit(1).execute()
-                                if result.data and len(result.data) > 0:
-                                    plant_id = result.data[0]['id']
-                                    print(f"   🔄 Reusing existing plant: {result.data[0]['common_name']} ({plant_id})")
-
-                            # STEP 2: If not found, create new plant in database
-                            if not plant_id and perenual_data.get('perenual_id'):
-                                try:
-                                    # Extract scientific_name from list if needed
-                                    sci_name_for_db = scientific_name
-                                    if isinstance(sci_name_for_db, list) and sci_name_for_db:
-                                        sci_name_for_db = sci_name_for_db[0]
-                                    
-                                    new_plant = supabase.table('plants').insert({
-                                        'perenual_id': perenual_data.get('perenual_id'),
-                                        'common_name': common_name,
-                                        'scientific_name': sci_name_for_db,
-                                        'watering_general_benchmark': perenual_data.get('watering_general_benchmark'),
-                                        'watering_interval_days': perenual_data.get('watering_interval_days'),
-                                        'sunlight': perenual_data.get('sunlight'),
-                                        'maintenance_category': perenual_data.get('maintenance_category'),
-                                        'poison_human': perenual_data.get('poison_human'),
-                                        'poison_pets': perenual_data.get('poison_pets'),
-                                        'default_image_url': perenual_data.get('default_image_url'),
-                                        'care_notes': perenual_data.get('care_notes'),
-                                    }).execute()
-
-                                    if new_plant.data and len(new_plant.data) > 0:
-                                        plant_id = new_plant.data[0]['id']
-                                        print(f"   ✅ Created new plant: {common_name} ({plant_id})")
-                                except Exception as e:
-                                    # If insert fails (duplicate), try to fetch the existing one
-                                    if 'duplicate' in str(e).lower() or 'unique' in str(e).lower():
-                                        result = supabase.table('plants').select('id').eq('perenual_id', perenual_data.get('perenual_id')).limit(1).execute()
-                                        if result.data and len(result.data) > 0:
-                                            plant_id = result.data[0]['id']
-                                            print(f"   🔄 Plant already exists: ({plant_id})")
-                                    else:
-                                        print(f"   ⚠️ Failed to create plant: {e}")
-
-                            # STEP 3: Add plant_id to the plant object so mobile can use it
-                            plant["plant_id"] = plant_id
+    if enrich_perenual:
+        # Collect every plant first so Perenual lookups are deduplicated
+        # per species and fanned out concurrently — the API round-trip,
+        # not parsing, dominates this loop, and the same species often
+        # recurs across rooms.
+        plant_entries: List[tuple] = []
+        for room_data in gemini_data.values():
+            for plant in room_data.get("plants") or ():
+                if plant.get("name") is None:
+                    continue
+                scientific_name = plant.get("scientific_name")
+
+                # Prefer scientific name for Perenual search (more accurate)
+                search_name = scientific_name if scientific_name else plant["name"]
+
+                if scientific_name:
+                    print(f"🔬 Searching Perenual by scientific name: {scientific_name}")
+                else:
+                    print(f"⚠️ No scientific name provided, using common name: {plant['name']}")
+
+                plant_entries.append((plant, search_name))
+
+        unique_names = {name for _, name in plant_entries if isinstance(name, str)}
+        try:
+            futures = {
+                name: prefetched.get(name)
+                or executor.submit(perenual_service.enrich_plant_with_perenual, name)
+                for name in unique_names
+            }
+            enriched = {name: future.result() for name, future in futures.items()}
+        finally:
+            executor.shutdown(wait=False)
+
+        for plant, search_name in plant_entries:
+            plant_name = plant["name"]
+            if search_name in enriched:
+                perenual_data = enriched[search_name]
+            else:
+                perenual_data = perenual_service.enrich_plant_with_perenual(search_name)
+            print(f"🌱 Perenual enrichment for '{plant_name}':")
+            print(f"   - Common name: {perenual_data.get('common_name')}")
+            print(f"   - Scientific name: {perenual_data.get('scientific_name')}")
+            print(f"   - Image URL: {perenual_data.get('default_image_url')}")
+            print(f"   - Error: {perenual_data.get('error')}")
+
+            # Add perenual_data to plant object (for mobile backward compat)
+            plant["perenual_data"] = perenual_data
+
+        def _sci_name(data: Dict[str, Any]) -> Optional[str]:
+            sci = data.get('scientific_name')
+            # Extract scientific_name from list if needed
+            if isinstance(sci, list):
+                sci = sci[0] if sci else None
+            return sci
+
+        # STEP 1: Look up all existing plants in one query instead of a
+        # Supabase round-trip per plant.
+        sci_names = {}
+        for data in enriched.values():
+            sci = _sci_name(data)
+            if sci:
+                sci_names.setdefault(sci.lower(), sci)
+        ids_by_sci: Dict[str, Any] = {}
+        ids_by_pid: Dict[Any, Any] = {}
+        if sci_names:
+            result = supabase.table('plants').select('id, common_name, scientific_name').in_(
+                'scientific_name', list(sci_names.values())
+            ).execute()
+            for row in result.data or []:
+                ids_by_sci[(row.get('scientific_name') or '').lower()] = row['id']
+                print(f"   🔄 Reusing existing plant: {row.get('common_name')} ({row['id']})")
+
+        # STEP 2: Create the plants that are still missing with a single
+        # multi-row insert; on a duplicate race, re-read ids in bulk.
+        rows = []
+        seen_pids = set()
+        for data in enriched.values():
+            sci = _sci_name(data)
+            perenual_id = data.get('perenual_id')
+            if not perenual_id or perenual_id in seen_pids:
+                continue
+            if sci and sci.lower() in ids_by_sci:
+                continue
+            seen_pids.add(perenual_id)
+            rows.append({
+                'perenual_id': perenual_id,
+                'common_name': data.get('common_name'),
+                'scientific_name': sci,
+                'watering_general_benchmark': data.get('watering_general_benchmark'),
+                'watering_interval_days': data.get('watering_interval_days'),
+                'sunlight': data.get('sunlight'),
+                'maintenance_category': data.get('maintenance_category'),
+                'poison_human': data.get('poison_human'),
+                'poison_pets': data.get('poison_pets'),
+                'default_image_url': data.get('default_image_url'),
+                'care_notes': data.get('care_notes'),
+            })
+        if rows:
+            try:
+                new_plants = supabase.table('plants').insert(rows).execute()
+                for row in new_plants.data or []:
+                    if row.get('scientific_name'):
+                        ids_by_sci[row['scientific_name'].lower()] = row['id']
+                    ids_by_pid[row.get('perenual_id')] = row['id']
+                    print(f"   ✅ Created new plant: {row.get('common_name')} ({row['id']})")
+            except Exception as e:
+                # If the insert races a duplicate, fetch the existing ids
+                if 'duplicate' in str(e).lower() or 'unique' in str(e).lower():
+                    result = supabase.table('plants').select('id, scientific_name, perenual_id').in_(
+                        'perenual_id', [row['perenual_id'] for row in rows]
+                    ).execute()
+                    for row in result.data or []:
+                        if row.get('scientific_name'):
+                            ids_by_sci[row['scientific_name'].lower()] = row['id']
+                        ids_by_pid[row.get('perenual_id')] = row['id']
+                        print(f"   🔄 Plant already exists: ({row['id']})")
+                else:
+                    print(f"   ⚠️ Failed to create plants: {e}")
+
+        # STEP 3: Add plant_id to each plant object so mobile can use it
+        for plant, _ in plant_entries:
+            data = plant["perenual_data"]
+            sci = _sci_name(data)
+            plant_id = ids_by_sci.get(sci.lower()) if sci else None
+            if plant_id is None:
+                plant_id = ids_by_pid.get(data.get('perenual_id'))
+            plant["plant_id"] = plant_id
 
     # Build structured response
-    roomplan_summary = _summarize_roomplan(plan, window_orientation)
-
     return {
         "user_id": user_id,
         "roomplan_summary": roomplan_summary,
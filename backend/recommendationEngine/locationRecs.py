@@ -3,12 +3,12 @@ import os
 from typing import Any, Dict, List, Optional
 
 import requests
-from dotenv import load_dotenv
-from supabase import Client, create_client
+from requests.adapters import HTTPAdapter
 
-# load .env from the backend root (adjust path if your .env lives elsewhere)
-ROOT = os.path.abspath(os.path.join(os.path.dirname(__file__), "..", ".."))
-load_dotenv(os.path.join(ROOT, ".env"))
+from heyday_backend._env import ensure_env
+
+# load .env from the repo root (shared, parsed once per process)
+ensure_env()
 
 api_key = os.getenv("GEMINI_API_KEY")
 supabase_url = os.getenv("SUPABASE_URL")
@@ -21,18 +21,36 @@ if not supabase_url or not supabase_key:
 if not perenual_key:
     raise RuntimeError("Missing PERENUAL_API_KEY environment variable")
 
-client = genai.Client(api_key=api_key)
-supabase: Client = create_client(supabase_url, supabase_key)
+# Clients are shared with floorPlanRecs — one Supabase connection pool
+# and one configured Gemini SDK per process — and created on first use.
+# Point SUPABASE_URL at the PgBouncer pooler endpoint in deployments
+# that need to cap database connections.
+client = None
+supabase = None
+
+
+def _ensure_clients() -> None:
+    global client, supabase
+    if supabase is None or client is None:
+        from . import floorPlanRecs
+
+        supabase = floorPlanRecs._get_supabase()
+        client = floorPlanRecs._get_genai()
 
 DEFAULT_MODEL = "gemini-2.5-flash"
 PERENUAL_BASE = "https://perenual.com/api"
 
+# Keep-alive session shared across Perenual calls (see perenual_service)
+_SESSION = requests.Session()
+_SESSION.mount("https://", HTTPAdapter(pool_connections=20, pool_maxsize=50))
+
 
 def _fetch_user_location(user_id: str) -> Dict[str, Optional[str]]:
     """
     Pull minimal location context for a user from Supabase.
     Returns a dict with city/region/country and optional climate tags.
     """
+    _ensure_clients()
     resp = supabase.table("users").select("city,region,country,climate_zone,notes").eq("id", user_id).maybe_single()
     if resp.error:
         raise RuntimeError(f"Supabase error: {resp.error}")
@@ -72,6 +90,7 @@ def _parse_json_text(text: str) -> Any:
 
 
 def _call_gemini_for_names(prompt: str, model: str, limit: int) -> List[str]:
+    _ensure_clients()
     response = client.responses.generate(
         model=model,
         contents=prompt,
@@ -97,7 +116,7 @@ def _call_gemini_for_names(prompt: str, model: str, limit: int) -> List[str]:
 
 def _perenual_get_json(path: str, params: Dict[str, Any]) -> Dict[str, Any]:
     url = f"{PERENUAL_BASE}{path}"
-    resp = requests.get(url, params=params, timeout=10)
+    resp = _SESSION.get(url, params=params, timeout=10)
     if resp.status_code >= 400:
         raise RuntimeError(f"Perenual error {resp.status_code}: {resp.text[:200]}")
     return resp.json()
@@ -4,15 +4,17 @@ This module provides a single source of truth for Perenual API interactions,
 ensuring consistent data formatting across the backend.
 """
 import os
+import re
 from functools import lru_cache
 from typing import Any, Dict, Optional
 
 import requests
-from dotenv import load_dotenv
+from requests.adapters import HTTPAdapter
 
-# Load environment variables
-ROOT = os.path.abspath(os.path.join(os.path.dirname(__file__), "..", ".."))
-load_dotenv(os.path.join(ROOT, ".env"))
+from heyday_backend._env import ensure_env
+
+# Load environment variables (shared, parsed once per process)
+ensure_env()
 
 PERENUAL_API_KEY = os.getenv("PERENUAL_API_KEY")
 PERENUAL_BASE_URL = "https://perenual.com/api"
@@ -20,6 +22,13 @@ PERENUAL_BASE_URL = "https://perenual.com/api"
 if not PERENUAL_API_KEY:
     raise RuntimeError("Missing PERENUAL_API_KEY environment variable")
 
+# Shared session so keep-alive connections are reused across lookups;
+# a plain requests.get pays a fresh TCP+TLS handshake per call. Retries
+# stay in _perenual_request's explicit loop, which has custom 429
+# handling, rather than in the adapter.
+_SESSION = requests.Session()
+_SESSION.mount("https://", HTTPAdapter(pool_connections=20, pool_maxsize=50))
+
 
 def _perenual_request(endpoint: str, params: Optional[Dict[str, Any]] = None, max_retries: int = 3) -> Dict[str, Any]:
     """Make a request to the Perenual API with timeout, rate limit handling, and retries."""
@@ -32,7 +41,7 @@ def _perenual_request(endpoint: str, params: Optional[Dict[str, Any]] = None, ma
     
     for attempt in range(max_retries):
         try:
-            response = requests.get(url, params=params, timeout=10)
+            response = _SESSION.get(url, params=params, timeout=10)
             
             # Handle rate limiting with exponential backoff
             if response.status_code == 429:
@@ -87,7 +96,68 @@ def _parse_plant_name(full_name: str) -> tuple:
         return (full_name.strip(), None)
 
 
-@lru_cache(maxsize=256)
+# Watering keyword → rough interval in days, resolved with one compiled
+# scan instead of chained substring checks.
+_WATER_RE = re.compile(r"\b(daily|frequent|average|moderate|minimum|rare)\b")
+_WATER_DAYS = {
+    "daily": 1,
+    "frequent": 1,
+    "average": 3,
+    "moderate": 3,
+    "minimum": 7,
+    "rare": 7,
+}
+
+
+# Successful lookups persist in the shared Django cache (Redis when
+# configured) for a week — species data changes rarely and the same
+# plants recur across users, so warm processes skip the API entirely.
+_SHARED_CACHE_TTL = 7 * 24 * 3600
+
+
+def _shared_cache():
+    """Return the Django cache when running inside a configured project.
+
+    This module is also usable standalone (no Django settings), so the
+    lookup degrades to the in-process LRU alone in that case.
+    """
+    try:
+        from django.conf import settings
+
+        if not settings.configured:
+            return None
+        from django.core.cache import cache
+
+        return cache
+    except ImportError:
+        return None
+
+
+def _supabase_plant_row(normalized_name: str) -> Optional[Dict[str, Any]]:
+    """Return a stored plants row for a scientific-name match, if any.
+
+    The recommendation flow persists every enriched plant to Supabase,
+    so a known species can skip the Perenual API entirely. Any failure
+    (no credentials, unreachable Supabase) falls back to the API path.
+    """
+    try:
+        from . import floorPlanRecs
+
+        supabase = floorPlanRecs._get_supabase()
+        result = (
+            supabase.table("plants")
+            .select("*")
+            .ilike("scientific_name", normalized_name)
+            .limit(1)
+            .execute()
+        )
+    except Exception:
+        return None
+    rows = result.data or []
+    return rows[0] if rows else None
+
+
+@lru_cache(maxsize=4096)
 def _enrich_plant_cached(normalized_name: str) -> Dict[str, Any]:
     """
     Cached version of plant enrichment.
@@ -98,6 +168,24 @@ def _enrich_plant_cached(normalized_name: str) -> Dict[str, Any]:
     Returns:
         Dict matching Supabase plants table schema
     """
+    row = _supabase_plant_row(normalized_name)
+    if row is not None:
+        return {
+            "name": normalized_name,
+            "perenual_id": row.get("perenual_id"),
+            "common_name": row.get("common_name"),
+            "scientific_name": row.get("scientific_name"),
+            "watering_general_benchmark": row.get("watering_general_benchmark"),
+            "watering_interval_days": row.get("watering_interval_days"),
+            "sunlight": row.get("sunlight"),
+            "maintenance_category": row.get("maintenance_category"),
+            "poison_human": row.get("poison_human"),
+            "poison_pets": row.get("poison_pets"),
+            "default_image_url": row.get("default_image_url"),
+            "care_notes": row.get("care_notes"),
+            "error": None,
+        }
+
     try:
         # Step 1: Search for the plant
         search_results = _perenual_request("/species-list", {"q": normalized_name, "page": 1})
@@ -246,13 +334,9 @@ def _enrich_plant_cached(normalized_name: str) -> Dict[str, Any]:
         # Calculate watering interval in days (rough estimate)
         watering_interval = None
         if watering_text:
-            watering_lower = watering_text.lower()
-            if "daily" in watering_lower or "frequent" in watering_lower:
-                watering_interval = 1
-            elif "average" in watering_lower or "moderate" in watering_lower:
-                watering_interval = 3
-            elif "minimum" in watering_lower or "rare" in watering_lower:
-                watering_interval = 7
+            match = _WATER_RE.search(watering_text.lower())
+            if match:
+                watering_interval = _WATER_DAYS[match.group(1)]
 
         # Parse common name (may contain scientific name in parentheses)
         raw_common_name = details.get("common_name")
@@ -364,6 +448,18 @@ def enrich_plant_with_perenual(plant_name: str) -> Dict[str, Any]:
 
     # Normalize for caching
     normalized = plant_name.strip().lower()
+
+    shared = _shared_cache()
+    if shared is not None:
+        key = f"perenual:{normalized}"
+        data = shared.get(key)
+        if data is None:
+            data = _enrich_plant_cached(normalized)
+            # Failed lookups are not persisted; a later retry may succeed.
+            if not data.get("error"):
+                shared.set(key, data, _SHARED_CACHE_TTL)
+        return data
+
     return _enrich_plant_cached(normalized)
 
 
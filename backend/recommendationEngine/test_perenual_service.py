@@ -22,7 +22,7 @@ class TestPerenualService(unittest.TestCase):
         self.assertIsNotNone(result["error"])
         self.assertIn("Empty plant name", result["error"])
 
-    @patch('recommendationEngine.perenual_service.requests.get')
+    @patch('recommendationEngine.perenual_service._SESSION.get')
     def test_enrich_no_results(self, mock_get):
         """Test handling when Perenual returns no results."""
         mock_response = MagicMock()
@@ -37,7 +37,7 @@ class TestPerenualService(unittest.TestCase):
         self.assertIsNotNone(result["error"])
         self.assertIn("No Perenual match found", result["error"])
 
-    @patch('recommendationEngine.perenual_service.requests.get')
+    @patch('recommendationEngine.perenual_service._SESSION.get')
     def test_enrich_api_error(self, mock_get):
         """Test handling when Perenual API returns error."""
         mock_get.side_effect = Exception("API connection failed")
@@ -47,7 +47,7 @@ class TestPerenualService(unittest.TestCase):
         self.assertIsNotNone(result["error"])
         self.assertIn("Enrichment failed", result["error"])
 
-    @patch('recommendationEngine.perenual_service.requests.get')
+    @patch('recommendationEngine.perenual_service._SESSION.get')
     def test_enrich_successful(self, mock_get):
         """Test successful plant enrichment."""
         # Mock search response
@@ -107,7 +107,7 @@ class TestPerenualService(unittest.TestCase):
         self.assertIn("Watering:", result["care_notes"])
         self.assertIsNone(result["error"])
 
-    @patch('recommendationEngine.perenual_service.requests.get')
+    @patch('recommendationEngine.perenual_service._SESSION.get')
     def test_cache_functionality(self, mock_get):
         """Test that results are cached on subsequent calls."""
         # Mock response
@@ -151,7 +151,7 @@ class TestPerenualService(unittest.TestCase):
 
     def test_watering_interval_parsing(self):
         """Test watering interval day estimation."""
-        with patch('recommendationEngine.perenual_service.requests.get') as mock_get:
+        with patch('recommendationEngine.perenual_service._SESSION.get') as mock_get:
             # Test "Frequent" watering
             search_resp = MagicMock()
             search_resp.status_code = 200